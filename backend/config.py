@@ -34,11 +34,50 @@ MIN_CHUNK_SIZE = 100  # words
 EMBEDDING_MODEL = "sentence-transformers/all-mpnet-base-v2"
 EMBEDDING_DIM = 768
 
+# Thread settings for FAISS/BLAS. These must be in the environment before the first
+# OpenMP runtime loads (faiss, torch), which is why they live here: config is imported first.
+# PASSIVE stops idle OpenMP threads from spinning and starving the other libraries' threads.
+os.environ.setdefault("OMP_WAIT_POLICY", "PASSIVE")
+os.environ.setdefault("MKL_NUM_THREADS", str(os.cpu_count()))
+FAISS_NUM_THREADS = int(os.getenv("FAISS_NUM_THREADS", os.cpu_count()))
+
 # Vector database settings
 FAISS_INDEX_PATH = VECTOR_DB_DIR / "faiss_index.bin"
 METADATA_PATH = VECTOR_DB_DIR / "metadata.json"
 TOP_K_RESULTS = 5
 
+# HNSW graph parameters (neighbors per node, build-time and query-time beam width)
+HNSW_M = 32
+HNSW_EF_CONSTRUCTION = 40
+HNSW_EF_SEARCH = 16
+
+# doc_ids filters with at most this many chunks are scored exactly instead of through
+# the HNSW graph; larger ones widen efSearch for selectivity, up to the cap
+FILTER_EXACT_MAX = 4096
+HNSW_FILTER_EF_MAX = 1024
+
+# Store vectors scalar-quantized inside the HNSW index ("QT_8bit" = 4x smaller, "QT_fp16" = 2x)
+USE_SCALAR_QUANTIZER = os.getenv("USE_SCALAR_QUANTIZER", "false").lower() == "true"
+SCALAR_QUANTIZER_TYPE = os.getenv("SCALAR_QUANTIZER_TYPE", "QT_8bit")
+# Vectors stay unquantized until there are this many to train the quantizer on
+SCALAR_QUANTIZER_MIN_TRAIN = int(os.getenv("SCALAR_QUANTIZER_MIN_TRAIN", "4096"))
+
+# Approximate query cache: reuse results for queries at least this cosine-similar
+QUERY_CACHE_THRESHOLD = 0.95
+QUERY_CACHE_SIZE = 1024  # cached queries, 0 disables the cache
+
+# Micro-batching of concurrent async searches into one FAISS call
+SEARCH_BATCH_MAX = 32
+SEARCH_BATCH_WAIT_MS = 5
+
+# GPU mirror of the index (needs a faiss GPU build); used only for large unfiltered
+# batches, since transfer overhead dominates single queries on small indexes
+GPU_MIN_VECTORS = 50000
+GPU_MIN_BATCH = 32
+
+# Rebuild the index once deleted (tombstoned) chunks exceed this fraction of it
+TOMBSTONE_COMPACT_RATIO = 0.3
+
 # LLM settings
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
 USE_OPENAI = bool(OPENAI_API_KEY)
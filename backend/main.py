@@ -283,7 +283,10 @@ async def process_document(doc_id: str, file_path: Path):
         
         # Step 2: Text cleaning
         print(f"Processing document {doc_id}: Text cleaning...")
-        cleaned_text = text_cleaner.clean_full_document(raw_text)
+        cleaned_text = text_cleaner.clean_full_document(
+            raw_text,
+            method=ocr_result['metadata']['method']
+        )
         
         # Save processed text
         processed_path = config.PROCESSED_DIR / f"{doc_id}.txt"
@@ -401,8 +404,8 @@ async def query_documents(request: QueryRequest):
     if not request.question.strip():
         raise HTTPException(status_code=400, detail="Question cannot be empty")
     
-    # Use RAG engine to answer
-    response = rag_engine.query(
+    # Use RAG engine to answer; concurrent questions are batched in the vector search
+    response = await rag_engine.aquery(
         question=request.question,
         doc_ids=request.doc_ids,
         top_k=request.top_k
@@ -636,7 +639,7 @@ async def get_claim_explanation(claim_id: str):
     )
     
     # Generate detailed explanation
-    detailed_explanation = xai_explainer.generate_detailed_explanation(decision)
+    detailed_explanation = xai_explainer.generate_detailed_explanation(decision).to_dict()
     
     # Add audit trail
     detailed_explanation["audit_trail"] = xai_explainer.generate_audit_trail(decision)
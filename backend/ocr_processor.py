@@ -3,7 +3,7 @@ from PIL import Image
 from pdf2image import convert_from_path
 import PyPDF2
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Iterator
 import re
 import config
 
@@ -12,6 +12,9 @@ class OCRProcessor:
     """Handles OCR and text extraction from PDFs and images."""
     
     def __init__(self):
+        # Tesseract options built once: language plus automatic page segmentation with OSD
+        self._tess_cfg = f'--psm 1 -l {config.OCR_LANG}'
+        
         # Set Tesseract path (optional - only needed for scanned documents)
         try:
             pytesseract.pytesseract.tesseract_cmd = config.TESSERACT_CMD
@@ -77,18 +80,24 @@ class OCRProcessor:
         }
         
         try:
-            # Try digital text extraction first
+            # Try digital text extraction first, one page at a time
             with open(pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
+                pdf_reader = PyPDF2.PdfReader(file, strict=False)
                 result['metadata']['page_count'] = len(pdf_reader.pages)
+                pages = self._iter_pages_from_pdf(pdf_reader)
                 
-                for page_num, page in enumerate(pdf_reader.pages, 1):
-                    page_text = page.extract_text()
-                    result['pages'].append({
-                        'page_number': page_num,
-                        'text': page_text
-                    })
-                    result['text'] += f"\n--- Page {page_num} ---\n{page_text}"
+                # Scanned PDFs have no text layer: if the first page is empty,
+                # skip extracting the remaining pages and go straight to OCR
+                first_page = next(pages, None)
+                if first_page is None:
+                    result['pages'] = []
+                elif len(first_page['text'].strip()) < 50 and self.tesseract_available:
+                    print(f"No text on first page, using OCR for {pdf_path.name}")
+                    return self._ocr_pdf(pdf_path)
+                else:
+                    result['pages'] = [first_page, *pages]
+            
+            result['text'] = self._join_pages(result['pages'])
             
             # If very little text extracted, use OCR (if available)
             if len(result['text'].strip()) < 100:
@@ -108,6 +117,20 @@ class OCRProcessor:
         
         return result
     
+    def _iter_pages_from_pdf(self, pdf_reader: PyPDF2.PdfReader) -> Iterator[Dict]:
+        """Lazily yield page dicts from an open PDF, extracting one page at a time."""
+        for page_num, page in enumerate(pdf_reader.pages, 1):
+            yield {
+                'page_number': page_num,
+                'text': page.extract_text()
+            }
+    
+    def _join_pages(self, pages: List[Dict]) -> str:
+        """Build the full document text from page dicts in a single join."""
+        return "".join(
+            f"\n--- Page {page['page_number']} ---\n{page['text']}" for page in pages
+        )
+    
     def _ocr_pdf(self, pdf_path: Path) -> Dict[str, any]:
         """Perform OCR on PDF by converting to images."""
         if not self.tesseract_available:
@@ -129,17 +152,14 @@ class OCRProcessor:
             
             for page_num, image in enumerate(images, 1):
                 # Perform OCR
-                page_text = pytesseract.image_to_string(
-                    image,
-                    lang=config.OCR_LANG,
-                    config='--psm 1'  # Automatic page segmentation with OSD
-                )
+                page_text = pytesseract.image_to_string(image, config=self._tess_cfg)
                 
                 result['pages'].append({
                     'page_number': page_num,
                     'text': page_text
                 })
-                result['text'] += f"\n--- Page {page_num} ---\n{page_text}"
+            
+            result['text'] = self._join_pages(result['pages'])
         
         except Exception as e:
             raise Exception(f"OCR processing failed: {e}")
@@ -164,11 +184,7 @@ class OCRProcessor:
             image = Image.open(image_path)
             
             # Perform OCR
-            text = pytesseract.image_to_string(
-                image,
-                lang=config.OCR_LANG,
-                config='--psm 1'
-            )
+            text = pytesseract.image_to_string(image, config=self._tess_cfg)
             
             result['text'] = text
             result['pages'].append({
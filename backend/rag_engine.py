@@ -1,4 +1,6 @@
+import asyncio
 import os
+import re
 from typing import List, Dict, Optional
 import config
 from models import QueryRequest, QueryResponse, SourceChunk
@@ -28,7 +30,31 @@ class RAGEngine:
             print("Using OpenAI for LLM")
         else:
             self.llm_type = "ollama"
+            import requests
+            from requests.adapters import HTTPAdapter
+            # Reuse keep-alive connections to Ollama across queries
+            self._ollama_session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+            self._ollama_session.mount("http://", adapter)
+            self._ollama_session.mount("https://", adapter)
             print("Using Ollama for LLM (make sure Ollama is running)")
+        
+        # Field patterns for the fallback answer, compiled once instead of per question
+        self._fallback_patterns = {
+            name: re.compile(pattern, re.IGNORECASE)
+            for name, pattern in {
+                'policy_number': r'Policy\s*(?:No|Number|#)?[:\s]+([A-Z]{3}-\d{4}-[A-Z]{2}-\d{6})',
+                'policy_number_loose': r'Policy\s*(?:No|Number|#)?[:\s]+([A-Z0-9\-/]{10,})',
+                'claim_amount': r'(?:Claim\s*Amount|Total\s*Claim|TOTAL\s*PAYABLE)[:\s]*₹?\s*([\d,]+(?:\.\d{2})?)',
+                'hospital': r'Hospital\s*(?:Name)?[:\s]*([A-Z][a-zA-Z\s&]+(?:Hospital|Medical|Clinic))',
+                'diagnosis': r'Diagnosis[:\s]*([A-Z][a-zA-Z\s]+)',
+                'sum_assured': r'Sum\s*Assured[:\s]*₹?\s*([\d,]+)',
+                'patient_name': r'Patient\s*Name[:\s]*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)',
+                'summary_policy': r'Policy\s*(?:No|Number)?[:\s]*([A-Z0-9\-/]+)',
+                'summary_claim': r'(?:Claim\s*Amount|TOTAL)[:\s]*₹?\s*([\d,]+)',
+                'summary_hospital': r'Hospital[:\s]*([A-Z][a-zA-Z\s&]+Hospital)',
+            }.items()
+        }
     
     def query(
         self,
@@ -57,6 +83,51 @@ class RAGEngine:
             doc_ids=doc_ids
         )
         
+        return self._build_response(question, search_results)
+    
+    async def aquery(
+        self,
+        question: str,
+        doc_ids: Optional[List[str]] = None,
+        top_k: int = 5
+    ) -> QueryResponse:
+        """
+        Answer a question using RAG without blocking the event loop.
+        
+        Embedding and answer generation run in the default thread pool, and retrieval
+        goes through VectorStore.asearch so concurrent questions share one FAISS search.
+        
+        Args:
+            question: User's question
+            doc_ids: Optional list of document IDs to search within
+            top_k: Number of chunks to retrieve
+            
+        Returns:
+            QueryResponse with answer and sources
+        """
+        loop = asyncio.get_running_loop()
+        
+        question_embedding = await loop.run_in_executor(None, self.embedder.embed_text, question)
+        
+        search_results = await self.vector_store.asearch(
+            query_embedding=question_embedding,
+            top_k=top_k,
+            doc_ids=doc_ids
+        )
+        
+        return await loop.run_in_executor(None, self._build_response, question, search_results)
+    
+    def _build_response(self, question: str, search_results: List) -> QueryResponse:
+        """
+        Generate the answer and response for retrieved chunks.
+        
+        Args:
+            question: User's question
+            search_results: (metadata, similarity) tuples from the vector store
+            
+        Returns:
+            QueryResponse with answer and sources
+        """
         if not search_results:
             return QueryResponse(
                 question=question,
@@ -66,11 +137,11 @@ class RAGEngine:
             )
         
         # Step 3: Prepare context from retrieved chunks
-        context_chunks = []
+        context_parts = []
         sources = []
         
-        for metadata, similarity in search_results:
-            context_chunks.append(metadata['text'])
+        for i, (metadata, similarity) in enumerate(search_results, 1):
+            context_parts.append(f"[Source {i}]: {metadata['text']}")
             sources.append(SourceChunk(
                 text=metadata['text'],
                 doc_id=metadata['doc_id'],
@@ -80,7 +151,7 @@ class RAGEngine:
                 similarity_score=similarity
             ))
         
-        context = "\n\n".join([f"[Source {i+1}]: {chunk}" for i, chunk in enumerate(context_chunks)])
+        context = "\n\n".join(context_parts)
         
         # Step 4: Generate answer using LLM
         answer = self._generate_answer(question, context)
@@ -162,7 +233,7 @@ Answer:"""
             
             print(f"Sending request to Ollama at {config.OLLAMA_BASE_URL}")
             
-            response = requests.post(
+            response = self._ollama_session.post(
                 f"{config.OLLAMA_BASE_URL}/api/generate",
                 json={
                     "model": config.OLLAMA_MODEL,
@@ -205,8 +276,7 @@ Answer:"""
         Generate a simple answer by extracting information from context.
         Used as fallback when LLM is unavailable.
         """
-        import re
-        
+        patterns = self._fallback_patterns
         question_lower = question.lower()
         
         # Extract first 500 characters of context for answer
@@ -214,42 +284,42 @@ Answer:"""
         
         # Try to extract specific information based on question keywords
         if "policy number" in question_lower:
-            match = re.search(r'Policy\s*(?:No|Number|#)?[:\s]+([A-Z]{3}-\d{4}-[A-Z]{2}-\d{6})', context, re.IGNORECASE)
+            match = patterns['policy_number'].search(context)
             if not match:
-                match = re.search(r'Policy\s*(?:No|Number|#)?[:\s]+([A-Z0-9\-/]{10,})', context, re.IGNORECASE)
+                match = patterns['policy_number_loose'].search(context)
             if match:
                 return f"Based on the documents, the policy number is {match.group(1)}."
         
         elif "claim amount" in question_lower or "claim" in question_lower and "amount" in question_lower:
-            match = re.search(r'(?:Claim\s*Amount|Total\s*Claim|TOTAL\s*PAYABLE)[:\s]*₹?\s*([\d,]+(?:\.\d{2})?)', context, re.IGNORECASE)
+            match = patterns['claim_amount'].search(context)
             if match:
                 return f"Based on the documents, the claim amount is ₹{match.group(1)}."
         
         elif "hospital" in question_lower:
-            match = re.search(r'Hospital\s*(?:Name)?[:\s]*([A-Z][a-zA-Z\s&]+(?:Hospital|Medical|Clinic))', context, re.IGNORECASE)
+            match = patterns['hospital'].search(context)
             if match:
                 return f"Based on the documents, the hospital mentioned is {match.group(1).strip()}."
         
         elif "diagnosis" in question_lower:
-            match = re.search(r'Diagnosis[:\s]*([A-Z][a-zA-Z\s]+)', context, re.IGNORECASE)
+            match = patterns['diagnosis'].search(context)
             if match:
                 return f"Based on the documents, the diagnosis is {match.group(1).strip()}."
         
         elif "sum assured" in question_lower or "coverage" in question_lower:
-            match = re.search(r'Sum\s*Assured[:\s]*₹?\s*([\d,]+)', context, re.IGNORECASE)
+            match = patterns['sum_assured'].search(context)
             if match:
                 return f"Based on the documents, the sum assured is ₹{match.group(1)}."
         
         elif "patient" in question_lower or "name" in question_lower:
-            match = re.search(r'Patient\s*Name[:\s]*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)', context, re.IGNORECASE)
+            match = patterns['patient_name'].search(context)
             if match:
                 return f"Based on the documents, the patient name is {match.group(1).strip()}."
         
         elif "summarize" in question_lower or "summary" in question_lower:
             # Extract key information for summary
-            policy_num = re.search(r'Policy\s*(?:No|Number)?[:\s]*([A-Z0-9\-/]+)', context, re.IGNORECASE)
-            claim_amt = re.search(r'(?:Claim\s*Amount|TOTAL)[:\s]*₹?\s*([\d,]+)', context, re.IGNORECASE)
-            hospital = re.search(r'Hospital[:\s]*([A-Z][a-zA-Z\s&]+Hospital)', context, re.IGNORECASE)
+            policy_num = patterns['summary_policy'].search(context)
+            claim_amt = patterns['summary_claim'].search(context)
+            hospital = patterns['summary_hospital'].search(context)
             
             summary_parts = []
             if policy_num:
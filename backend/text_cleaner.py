@@ -4,24 +4,73 @@ from typing import Dict, List
 from dateutil import parser
 
 
+# Upper bound on cached date strings; the cache is reset when it fills up
+DATE_CACHE_SIZE = 4096
+
+
 class TextCleaner:
     """Cleans and normalizes extracted text."""
     
     def __init__(self):
+        # Ordered by how often they appear in claim documents, most common first
         self.date_formats = [
-            "%d/%m/%Y", "%d-%m-%Y", "%d.%m.%Y",
-            "%d/%m/%y", "%d-%m-%y",
-            "%Y-%m-%d", "%Y/%m/%d",
-            "%d %B %Y", "%d %b %Y",
-            "%B %d, %Y", "%b %d, %Y"
+            "%d/%m/%Y", "%d-%m-%Y", "%d/%m/%y", "%d-%m-%y",
+            "%d %b %Y", "%d %B %Y",
+            "%b %d, %Y", "%B %d, %Y",
+            "%d.%m.%Y", "%Y-%m-%d", "%Y/%m/%d"
+        ]
+        
+        # Potential dates to normalize
+        self._re_dates = [
+            re.compile(pattern, re.IGNORECASE)
+            for pattern in [
+                r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b',
+                r'\b\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{2,4}\b',
+                r'\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2},?\s+\d{2,4}\b',
+            ]
+        ]
+        
+        # Normalized dates keyed by the raw matched string
+        self._date_cache: Dict[str, str] = {}
+        
+        # Precompiled cleaning patterns (compiled once per cleaner, not per call)
+        self._re_whitespace = re.compile(r'\s+')
+        self._re_special_chars = re.compile(r'[^\w\s\.,;:!?\-₹$/()\[\]@#%&*+=]+')
+        self._re_space_before_punct = re.compile(r'\s+([.,;:!?])')
+        self._re_punct_before_word = re.compile(r'([.,;:!?])(?=\w)')
+        self._re_repeated_punct = re.compile(r'[.,;:!?]{2,}')
+        
+        # OCR fixes, each anchored on its literal character so the regex engine can
+        # jump straight to candidates instead of testing lookbehinds at every position
+        self._re_ocr_fixes = [
+            (re.compile(r'0(?=\D)(?<!\d0)'), 'O'),      # 0 to O in words
+            (re.compile(r'l(?=\d)(?<![^\W\d]l)'), '1'),  # l to 1 in numbers
+            (re.compile(r'S(?=\d)(?<!\wS)'), '5'),       # S to 5 in numbers
         ]
+        
+        # Rs./INR/Rupees prefixes and bare ₹ amounts, handled in a single pass
+        self._re_currency = re.compile(
+            r'(?:Rs\.?|INR|Rupees)\s*(?P<prefixed>\d+(?:,\d+)*(?:\.\d{2})?)|₹\d+(?:\.\d{2})?',
+            re.IGNORECASE
+        )
+        self._re_rupee_amount = re.compile(r'₹(\d+(?:\.\d{2})?)')
+        
+        self._re_titles = [
+            re.compile(rf'\b({title})\.?\s+([a-z]+)', re.IGNORECASE)
+            for title in ['Mr', 'Mrs', 'Ms', 'Dr', 'Prof']
+        ]
+        self._re_policy_number = re.compile(
+            r'Policy\s*(?:No|Number|#)?\s*:?\s*([A-Z0-9\s\-/]+)', re.IGNORECASE
+        )
     
-    def clean_text(self, text: str) -> str:
+    def clean_text(self, text: str, method: str = 'ocr') -> str:
         """
         Clean and normalize text.
         
         Args:
             text: Raw extracted text
+            method: Extraction method ('ocr', 'digital' or 'text'); OCR error
+                fixes are only applied to OCR output
             
         Returns:
             Cleaned text
@@ -30,20 +79,21 @@ class TextCleaner:
             return ""
         
         # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = self._re_whitespace.sub(' ', text)
         
         # Remove special characters but keep important punctuation
-        text = re.sub(r'[^\w\s\.,;:!?\-₹$/()\[\]@#%&*+=]', '', text)
+        text = self._re_special_chars.sub('', text)
         
-        # Fix common OCR errors
-        text = self._fix_ocr_errors(text)
+        # Fix common OCR errors (digital and plain-text extraction has none)
+        if method == 'ocr':
+            text = self._fix_ocr_errors(text)
         
         # Normalize whitespace around punctuation
-        text = re.sub(r'\s+([.,;:!?])', r'\1', text)
-        text = re.sub(r'([.,;:!?])(\w)', r'\1 \2', text)
+        text = self._re_space_before_punct.sub(r'\1', text)
+        text = self._re_punct_before_word.sub(r'\1 ', text)
         
-        # Remove multiple consecutive punctuation
-        text = re.sub(r'([.,;:!?]){2,}', r'\1', text)
+        # Remove multiple consecutive punctuation (keep the last one)
+        text = self._re_repeated_punct.sub(lambda m: m.group()[-1], text)
         
         return text.strip()
     
@@ -57,38 +107,41 @@ class TextCleaner:
         Returns:
             Text with normalized dates
         """
-        # Find potential dates
-        date_patterns = [
-            r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b',
-            r'\b\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{2,4}\b',
-            r'\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2},?\s+\d{2,4}\b',
-        ]
-        
-        for pattern in date_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                date_str = match.group()
-                normalized = self._normalize_single_date(date_str)
-                if normalized:
-                    text = text.replace(date_str, normalized)
+        # Replace each matched date in place (one scan per pattern)
+        for pattern in self._re_dates:
+            text = pattern.sub(lambda m: self._normalize_single_date(m.group()), text)
         
         return text
     
     def _normalize_single_date(self, date_str: str) -> str:
         """Normalize a single date string to DD/MM/YYYY."""
+        cached = self._date_cache.get(date_str)
+        if cached is not None:
+            return cached
+        
+        if len(self._date_cache) >= DATE_CACHE_SIZE:
+            self._date_cache.clear()
+        
+        normalized = self._parse_date(date_str)
+        self._date_cache[date_str] = normalized
+        return normalized
+    
+    def _parse_date(self, date_str: str) -> str:
+        """Parse a date string, trying cheap fixed formats before dateutil."""
+        # Try manual formats
+        for fmt in self.date_formats:
+            try:
+                dt = datetime.strptime(date_str, fmt)
+                return dt.strftime("%d/%m/%Y")
+            except ValueError:
+                continue
+        
         try:
-            # Try parsing with dateutil
+            # Fall back to dateutil for free-form dates
             dt = parser.parse(date_str, dayfirst=True)
             return dt.strftime("%d/%m/%Y")
-        except:
-            # Try manual formats
-            for fmt in self.date_formats:
-                try:
-                    dt = datetime.strptime(date_str, fmt)
-                    return dt.strftime("%d/%m/%Y")
-                except:
-                    continue
-        return date_str  # Return original if parsing fails
+        except (ValueError, OverflowError):
+            return date_str  # Return original if parsing fails
     
     def normalize_currency(self, text: str) -> str:
         """
@@ -100,16 +153,6 @@ class TextCleaner:
         Returns:
             Text with normalized currency
         """
-        # Patterns for currency
-        patterns = [
-            (r'Rs\.?\s*(\d+(?:,\d+)*(?:\.\d{2})?)', r'₹\1'),
-            (r'INR\s*(\d+(?:,\d+)*(?:\.\d{2})?)', r'₹\1'),
-            (r'Rupees\s*(\d+(?:,\d+)*(?:\.\d{2})?)', r'₹\1'),
-        ]
-        
-        for pattern, replacement in patterns:
-            text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
-        
         # Ensure proper comma formatting for Indian numbering
         def format_indian_number(match):
             num_str = match.group(1).replace(',', '')
@@ -121,7 +164,15 @@ class TextCleaner:
             except:
                 return match.group(0)
         
-        text = re.sub(r'₹(\d+(?:\.\d{2})?)', format_indian_number, text)
+        # Convert Rs./INR/Rupees to ₹ and format amounts in the same pass
+        def normalize_amount(match):
+            if match.group('prefixed') is not None:
+                amount = f"₹{match.group('prefixed')}"
+            else:
+                amount = match.group()
+            return self._re_rupee_amount.sub(format_indian_number, amount)
+        
+        text = self._re_currency.sub(normalize_amount, text)
         
         return text
     
@@ -139,10 +190,8 @@ class TextCleaner:
         # In production, you'd use NER to identify names first
         
         # Capitalize after common titles
-        titles = ['Mr', 'Mrs', 'Ms', 'Dr', 'Prof']
-        for title in titles:
-            pattern = rf'\b({title})\.?\s+([a-z]+)'
-            text = re.sub(pattern, lambda m: f"{m.group(1)}. {m.group(2).title()}", text, flags=re.IGNORECASE)
+        for pattern in self._re_titles:
+            text = pattern.sub(lambda m: f"{m.group(1)}. {m.group(2).title()}", text)
         
         return text
     
@@ -157,43 +206,34 @@ class TextCleaner:
             Text with normalized policy numbers
         """
         # Remove spaces in policy numbers
-        pattern = r'Policy\s*(?:No|Number|#)?\s*:?\s*([A-Z0-9\s\-/]+)'
-        
         def normalize_policy(match):
             policy_num = match.group(1).replace(' ', '').upper()
             return f"Policy Number: {policy_num}"
         
-        text = re.sub(pattern, normalize_policy, text, flags=re.IGNORECASE)
+        text = self._re_policy_number.sub(normalize_policy, text)
         
         return text
     
     def _fix_ocr_errors(self, text: str) -> str:
         """Fix common OCR errors."""
         # Common OCR mistakes
-        replacements = {
-            r'\b0(?=\D)': 'O',  # 0 to O in words
-            r'(?<=\D)0(?=\D)': 'O',
-            r'\bl(?=\d)': '1',  # l to 1 in numbers
-            r'(?<=\d)l(?=\d)': '1',
-            r'\bS(?=\d)': '5',  # S to 5 in numbers
-        }
-        
-        for pattern, replacement in replacements.items():
-            text = re.sub(pattern, replacement, text)
+        for pattern, replacement in self._re_ocr_fixes:
+            text = pattern.sub(replacement, text)
         
         return text
     
-    def clean_full_document(self, text: str) -> str:
+    def clean_full_document(self, text: str, method: str = 'ocr') -> str:
         """
         Apply all cleaning and normalization steps.
         
         Args:
             text: Raw text
+            method: Extraction method reported by OCRProcessor ('ocr', 'digital' or 'text')
             
         Returns:
             Fully cleaned and normalized text
         """
-        text = self.clean_text(text)
+        text = self.clean_text(text, method)
         text = self.normalize_dates(text)
         text = self.normalize_currency(text)
         text = self.normalize_names(text)
@@ -1,14 +1,51 @@
+import asyncio
+import threading
+import config  # sets OpenMP/MKL thread environment, so it must come before faiss
 import faiss
 import numpy as np
 import json
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 from models import ChunkMetadata
-import config
+
+faiss.omp_set_num_threads(config.FAISS_NUM_THREADS)
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    print("Warning: pyarrow not installed. Vector store metadata will be saved as JSON.")
+
+# Per-chunk metadata fields, stored as one column each
+METADATA_FIELDS = ('chunk_id', 'doc_id', 'doc_type', 'filename', 'page_number', 'chunk_index', 'text')
+
+
+class _LazyColumn:
+    """Read-only view of an Arrow column; values become Python objects only when read."""
+    
+    def __init__(self, array):
+        self.array = array
+    
+    def __len__(self) -> int:
+        return len(self.array)
+    
+    def __getitem__(self, i: int):
+        return self.array[i].as_py()
+    
+    def to_list(self) -> list:
+        return self.array.to_pylist()
 
 
 class VectorStore:
-    """FAISS-based vector database for storing and retrieving document embeddings."""
+    """
+    FAISS-based vector database for storing and retrieving document embeddings.
+    
+    FAISS parallelizes each index.search across queries with OpenMP, so callers should
+    not add threads of their own; concurrent API requests share one batched search
+    through asearch().
+    """
     
     def __init__(
         self,
@@ -22,28 +59,179 @@ class VectorStore:
         Args:
             embedding_dim: Dimension of embeddings
             index_path: Path to save/load FAISS index
-            metadata_path: Path to save/load metadata
+            metadata_path: Path to save/load metadata (JSON; a Parquet file with
+                the same stem is used instead when pyarrow is installed)
         """
         self.embedding_dim = embedding_dim
         self.index_path = index_path
         self.metadata_path = metadata_path
         
+        # Size of the saved index file, refreshed on save() so get_stats() needs no syscall
+        self._index_size_bytes = index_path.stat().st_size if index_path.exists() else 0
+        
         # Initialize or load FAISS index
         if index_path.exists():
             self.index = faiss.read_index(str(index_path))
             print(f"Loaded existing FAISS index with {self.index.ntotal} vectors")
+            if self.index.metric_type != faiss.METRIC_INNER_PRODUCT:
+                self._migrate_to_inner_product()
         else:
-            # Create new index (using L2 distance)
-            self.index = faiss.IndexFlatL2(embedding_dim)
+            self.index = self._create_index()
             print(f"Created new FAISS index with dimension {embedding_dim}")
         
-        # Load or initialize metadata
-        if metadata_path.exists():
-            with open(metadata_path, 'r', encoding='utf-8') as f:
-                self.metadata = json.load(f)
-            print(f"Loaded metadata for {len(self.metadata)} chunks")
+        # Load or initialize metadata as columns (field -> list, row i = index id i)
+        self._parquet_path = metadata_path.with_suffix('.parquet')
+        self._cols: Dict[str, list] = self._load_metadata()
+        if len(self._cols['doc_id']) != self.index.ntotal:
+            # e.g. a save interrupted between the index and the metadata; search
+            # skips vectors without a metadata row
+            print(f"Warning: FAISS index has {self.index.ntotal} vectors but metadata has "
+                  f"{len(self._cols['doc_id'])} rows")
+        
+        # Deleted chunks keep their slot in the index with a None doc_id
+        self._tombstone_count = self._cols['doc_id'].count(None)
+        
+        # doc_id -> index ids of its live chunks, used for filtered search, deletes
+        # and chunk lookups
+        self._doc_vec_ids: Dict[str, List[int]] = {}
+        self._index_doc_ids()
+        
+        # Exact GPU copy of the vectors for large batches, when a GPU is available
+        self._gpu_res = None
+        self._gpu_index = None
+        self._sync_gpu_index()
+        
+        # Approximate query cache: normalized query embeddings in a FIFO ring
+        # buffer, with (search signature, results) stored alongside each key
+        self._cache_keys = np.zeros((config.QUERY_CACHE_SIZE, embedding_dim), dtype='float32')
+        self._cache_vals: List[Tuple[tuple, List[Tuple[Dict, float]]]] = []
+        self._cache_next = 0
+        
+        # Per-thread (1, d) buffer that synchronous searches normalize the query into
+        self._query_buf = threading.local()
+        
+        # Micro-batching state for asearch(), bound to the event loop that uses it
+        self._batch_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._batch_queue: Optional[asyncio.Queue] = None
+        self._batch_task: Optional[asyncio.Task] = None
+    
+    def _create_index(self, training_vectors: Optional[np.ndarray] = None) -> faiss.Index:
+        """
+        Create an empty inner-product HNSW index with the configured graph parameters.
+        
+        Args:
+            training_vectors: Normalized vectors to train a scalar quantizer on; the
+                index is only quantized when these are given
+        """
+        if training_vectors is not None:
+            # Vectors stored as quantized codes, with per-dimension ranges learned
+            # from the training vectors
+            qtype = getattr(faiss.ScalarQuantizer, config.SCALAR_QUANTIZER_TYPE)
+            index = faiss.IndexHNSWSQ(self.embedding_dim, qtype, config.HNSW_M, faiss.METRIC_INNER_PRODUCT)
+            index.train(training_vectors)
         else:
-            self.metadata = []
+            index = faiss.IndexHNSWFlat(self.embedding_dim, config.HNSW_M, faiss.METRIC_INNER_PRODUCT)
+        index.hnsw.efConstruction = config.HNSW_EF_CONSTRUCTION
+        index.hnsw.efSearch = config.HNSW_EF_SEARCH
+        return index
+    
+    def _add_vectors(self, vectors: np.ndarray):
+        """
+        Add normalized vectors to the index.
+        
+        With config.USE_SCALAR_QUANTIZER, vectors are kept in a flat index until there
+        are config.SCALAR_QUANTIZER_MIN_TRAIN of them; the index is then rebuilt as a
+        quantized one trained on all of them, since ranges learned from a first small
+        upload would clip most later vectors.
+        """
+        if config.USE_SCALAR_QUANTIZER and not isinstance(self.index, faiss.IndexHNSWSQ):
+            if self.index.ntotal + len(vectors) >= config.SCALAR_QUANTIZER_MIN_TRAIN:
+                # Existing vectors come first so every index id stays the same
+                if self.index.ntotal:
+                    vectors = np.vstack((self.index.reconstruct_n(0, self.index.ntotal), vectors))
+                self.index = self._create_index(training_vectors=vectors)
+                print(f"Building scalar-quantized FAISS index from {len(vectors)} vectors")
+        self.index.add(vectors)
+    
+    def _sync_gpu_index(self):
+        """
+        Mirror the vectors on the GPU once the index is large enough to benefit.
+        
+        FAISS can't run HNSW on the GPU, so the mirror is an exact inner-product flat
+        index with the same ids; the HNSW index stays the one that is saved.
+        """
+        if faiss.get_num_gpus() == 0 or self.index.ntotal < config.GPU_MIN_VECTORS:
+            self._gpu_index = None
+            return
+        
+        try:
+            if self._gpu_res is None:
+                self._gpu_res = faiss.StandardGpuResources()
+            flat_index = faiss.IndexFlatIP(self.embedding_dim)
+            flat_index.add(self.index.reconstruct_n(0, self.index.ntotal))
+            self._gpu_index = faiss.index_cpu_to_gpu(self._gpu_res, 0, flat_index)
+            print(f"Mirrored FAISS index on GPU ({self._gpu_index.ntotal} vectors)")
+        except Exception as e:
+            self._gpu_index = None
+            print(f"Warning: Could not move FAISS index to GPU, searching on CPU. Error: {e}")
+    
+    def _load_metadata(self) -> Dict[str, list]:
+        """Load metadata columns from Parquet or JSON, or start empty."""
+        if pa is not None and self._parquet_path.exists():
+            # The table is read into Arrow memory in full (Parquet pages are compressed),
+            # but kept as Arrow data so no per-value Python objects are created at
+            # startup; doc_id is needed up front for the doc_id map
+            table = pq.read_table(self._parquet_path)
+            cols = {name: _LazyColumn(table.column(name)) for name in METADATA_FIELDS}
+            cols['doc_id'] = table.column('doc_id').to_pylist()
+            print(f"Loaded metadata for {table.num_rows} chunks")
+            return cols
+        
+        if self.metadata_path.exists():
+            with open(self.metadata_path, 'r', encoding='utf-8') as f:
+                rows = json.load(f)
+            print(f"Loaded metadata for {len(rows)} chunks")
+            # Deleted chunks are stored as null rows
+            return {
+                name: [m[name] if m is not None else None for m in rows]
+                for name in METADATA_FIELDS
+            }
+        
+        if self._parquet_path.exists():
+            # Starting empty would leave the saved index with no metadata, and the
+            # next save would overwrite the Parquet file
+            raise RuntimeError(
+                f"{self._parquet_path} needs pyarrow to load; install pyarrow or remove the file"
+            )
+        return {name: [] for name in METADATA_FIELDS}
+    
+    def _materialize_columns(self):
+        """Convert Arrow columns to lists before they are modified."""
+        for name, col in self._cols.items():
+            if isinstance(col, _LazyColumn):
+                self._cols[name] = col.to_list()
+    
+    def _row(self, i: int) -> Dict:
+        """Build the metadata dict for one chunk."""
+        return {name: self._cols[name][i] for name in METADATA_FIELDS}
+    
+    def _index_doc_ids(self):
+        """Rebuild the doc_id -> index ids map and the live-row mask from the doc_id column."""
+        self._doc_vec_ids = {}
+        for i, doc_id in enumerate(self._cols['doc_id']):
+            if doc_id is not None:
+                self._doc_vec_ids.setdefault(doc_id, []).append(i)
+        self._live = np.array([d is not None for d in self._cols['doc_id']], dtype=bool)
+    
+    def _migrate_to_inner_product(self):
+        """Rebuild an index saved with L2 distance as a normalized inner-product index."""
+        vectors = self.index.reconstruct_n(0, self.index.ntotal)
+        faiss.normalize_L2(vectors)
+        
+        self.index = self._create_index()
+        if len(vectors):
+            self._add_vectors(vectors)
+        print(f"Migrated FAISS index to cosine similarity ({self.index.ntotal} vectors)")
     
     def add_embeddings(
         self,
@@ -60,31 +248,39 @@ class VectorStore:
         if len(embeddings) != len(chunks):
             raise ValueError("Number of embeddings must match number of chunks")
         
-        # Ensure embeddings are float32
-        embeddings = embeddings.astype('float32')
+        # Always copy, even when the input is already contiguous float32:
+        # faiss.normalize_L2 works in place and the caller's array must not change.
+        # Normalizing out of place with numpy instead is slower than copy + normalize_L2
+        embeddings = np.array(embeddings, dtype=np.float32, copy=True, order='C')
+        
+        # Unit-length vectors make inner product equal to cosine similarity
+        faiss.normalize_L2(embeddings)
         
         # Add to FAISS index
-        self.index.add(embeddings)
-        
-        # Add metadata
-        for chunk in chunks:
-            self.metadata.append({
-                'chunk_id': chunk.chunk_id,
-                'doc_id': chunk.doc_id,
-                'doc_type': chunk.doc_type,
-                'filename': chunk.filename,
-                'page_number': chunk.page_number,
-                'chunk_index': chunk.chunk_index,
-                'text': chunk.text
-            })
+        self._add_vectors(embeddings)
+        if self._gpu_index is not None:
+            self._gpu_index.add(embeddings)
+        else:
+            self._sync_gpu_index()
+        
+        # Add metadata; each chunk's index id is its row number in the columns
+        self._materialize_columns()
+        first_id = len(self._cols['doc_id'])
+        for offset, chunk in enumerate(chunks):
+            self._doc_vec_ids.setdefault(chunk.doc_id, []).append(first_id + offset)
+        for name in METADATA_FIELDS:
+            self._cols[name].extend(getattr(chunk, name) for chunk in chunks)
+        self._live = np.concatenate((self._live, np.ones(len(chunks), dtype=bool)))
         
+        self._clear_query_cache()
         print(f"Added {len(chunks)} chunks to vector store. Total: {self.index.ntotal}")
     
     def search(
         self,
         query_embedding: np.ndarray,
         top_k: int = config.TOP_K_RESULTS,
-        doc_ids: Optional[List[str]] = None
+        doc_ids: Optional[List[str]] = None,
+        ef_search: Optional[int] = None
     ) -> List[Tuple[Dict, float]]:
         """
         Search for similar chunks.
@@ -93,41 +289,271 @@ class VectorStore:
             query_embedding: Query embedding vector
             top_k: Number of results to return
             doc_ids: Optional list of document IDs to filter by
+            ef_search: HNSW search beam width (defaults to config.HNSW_EF_SEARCH);
+                higher values trade latency for recall
             
         Returns:
-            List of (metadata, similarity_score) tuples
+            List of (metadata, similarity_score) tuples, where the score is the
+            cosine similarity between the query and the chunk
         """
         if self.index.ntotal == 0:
             return []
         
-        # Ensure query is 2D and float32
-        query_embedding = query_embedding.astype('float32').reshape(1, -1)
+        query_embedding = self._prepare_query(query_embedding, reuse_buffer=True)
         
-        # Search in FAISS
-        # Get more results if filtering by doc_ids
-        search_k = top_k * 10 if doc_ids else top_k
-        distances, indices = self.index.search(query_embedding, min(search_k, self.index.ntotal))
+        # Near-duplicate queries with the same parameters reuse earlier results
+        signature = (top_k, frozenset(doc_ids) if doc_ids else None, ef_search)
+        cached = self._cache_lookup(query_embedding, signature)
+        if cached is not None:
+            return cached
         
-        # Retrieve metadata and convert distances to similarity scores
-        results = []
-        for dist, idx in zip(distances[0], indices[0]):
-            if idx < len(self.metadata):
-                metadata = self.metadata[idx]
-                
-                # Filter by doc_ids if specified
-                if doc_ids and metadata['doc_id'] not in doc_ids:
+        results = self._search_batch(query_embedding, top_k, doc_ids, ef_search)[0]
+        self._cache_store(query_embedding, signature, results)
+        return results
+    
+    async def asearch(
+        self,
+        query_embedding: np.ndarray,
+        top_k: int = config.TOP_K_RESULTS,
+        doc_ids: Optional[List[str]] = None,
+        ef_search: Optional[int] = None
+    ) -> List[Tuple[Dict, float]]:
+        """
+        Search for similar chunks, batching concurrent calls into one FAISS search.
+        
+        Queries that arrive within config.SEARCH_BATCH_WAIT_MS of each other (up to
+        config.SEARCH_BATCH_MAX) with the same parameters are stacked into a single
+        index.search call, which FAISS parallelizes across queries.
+        
+        Args:
+            query_embedding: Query embedding vector
+            top_k: Number of results to return
+            doc_ids: Optional list of document IDs to filter by
+            ef_search: HNSW search beam width (defaults to config.HNSW_EF_SEARCH)
+            
+        Returns:
+            List of (metadata, similarity_score) tuples, as returned by search()
+        """
+        if self.index.ntotal == 0:
+            return []
+        
+        query_embedding = self._prepare_query(query_embedding)
+        
+        signature = (top_k, frozenset(doc_ids) if doc_ids else None, ef_search)
+        cached = self._cache_lookup(query_embedding, signature)
+        if cached is not None:
+            return cached
+        
+        loop = asyncio.get_running_loop()
+        if self._batch_loop is not loop or self._batch_task.done():
+            # Queue and worker belong to the event loop that created them
+            self._batch_loop = loop
+            self._batch_queue = asyncio.Queue()
+            self._batch_task = loop.create_task(self._batch_worker(self._batch_queue))
+        
+        future = loop.create_future()
+        await self._batch_queue.put((query_embedding, signature, future))
+        results = await future
+        
+        self._cache_store(query_embedding, signature, results)
+        return results
+    
+    async def _batch_worker(self, queue: asyncio.Queue):
+        """Drain queued asearch() calls in micro-batches."""
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            # Wait for a first query, then collect more until the batch is full or the wait expires
+            batch = [await queue.get()]
+            deadline = loop.time() + config.SEARCH_BATCH_WAIT_MS / 1000
+            while len(batch) < config.SEARCH_BATCH_MAX:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            # One FAISS call per distinct (top_k, doc_ids, ef_search) in the batch
+            groups: Dict[tuple, list] = {}
+            for item in batch:
+                groups.setdefault(item[1], []).append(item)
+            
+            for (top_k, doc_ids, ef_search), items in groups.items():
+                # Any failure, including a query that can't be stacked, goes to every
+                # caller in the group so none of them waits forever
+                try:
+                    queries = np.vstack([query for query, _, _ in items])
+                    batch_results = self._search_batch(queries, top_k, doc_ids, ef_search)
+                except Exception as e:
+                    for _, _, future in items:
+                        if not future.done():
+                            future.set_exception(e)
                     continue
                 
-                # Convert L2 distance to similarity score (inverse)
-                # Lower distance = higher similarity
-                similarity = 1 / (1 + dist)
-                
-                results.append((metadata, float(similarity)))
-                
-                if len(results) >= top_k:
-                    break
+                for (_, _, future), results in zip(items, batch_results):
+                    # The caller may have been cancelled while waiting
+                    if not future.done():
+                        future.set_result(results)
+    
+    def _prepare_query(self, query_embedding: np.ndarray, reuse_buffer: bool = False) -> np.ndarray:
+        """
+        Return the query as a normalized float32 row vector.
         
-        return results
+        The query is always copied, since normalization is in place and the caller's
+        vector must not change. With reuse_buffer it is copied into this thread's
+        preallocated buffer, which is only valid until the thread's next search; queued
+        asearch() queries need their own array. A query of the wrong size raises
+        ValueError.
+        """
+        # Checked here so a bad query fails in its own caller, before the cache
+        # lookup or the asearch() queue
+        if query_embedding.size != self.embedding_dim:
+            raise ValueError(
+                f"Query embedding has {query_embedding.size} values, expected {self.embedding_dim}"
+            )
+        
+        if reuse_buffer:
+            query = getattr(self._query_buf, 'arr', None)
+            if query is None:
+                query = np.empty((1, self.embedding_dim), dtype=np.float32)
+                self._query_buf.arr = query
+            np.copyto(query, query_embedding.reshape(1, -1))
+        else:
+            query = query_embedding.astype('float32').reshape(1, -1)
+        faiss.normalize_L2(query)
+        return query
+    
+    def _search_batch(
+        self,
+        queries: np.ndarray,
+        top_k: int,
+        doc_ids: Optional[List[str]],
+        ef_search: Optional[int]
+    ) -> List[List[Tuple[Dict, float]]]:
+        """
+        Run one FAISS search for a batch of normalized queries.
+        
+        Args:
+            queries: Normalized query embeddings (shape: [num_queries, embedding_dim])
+            top_k: Number of results to return per query
+            doc_ids: Optional collection of document IDs to filter by
+            ef_search: HNSW search beam width (widened for selective doc_ids filters;
+                small filters are scored exactly instead)
+            
+        Returns:
+            One list of (metadata, similarity_score) tuples per query
+        """
+        if self.index.ntotal == 0:
+            return [[] for _ in range(len(queries))]
+        
+        # Per-call parameters, so concurrent searches don't share a mutable efSearch
+        ef = ef_search or config.HNSW_EF_SEARCH
+        
+        if doc_ids:
+            allowed = [i for doc_id in doc_ids for i in self._doc_vec_ids.get(doc_id, ())]
+            allowed = np.array(allowed, dtype='int64')
+            # Rows past the end of the index have no vector (metadata saved without it)
+            allowed = allowed[allowed < self.index.ntotal]
+            if not len(allowed):
+                return [[] for _ in range(len(queries))]
+            search_k = min(top_k, len(allowed))
+            
+            if len(allowed) <= config.FILTER_EXACT_MAX:
+                # Score the documents' own vectors exactly with one matrix product;
+                # for a small filter this is far cheaper than walking the graph past
+                # every excluded node
+                scores = queries @ self.index.reconstruct_batch(allowed).T
+                top = np.argpartition(-scores, search_k - 1, axis=1)[:, :search_k]
+                top_scores = np.take_along_axis(scores, top, axis=1)
+                order = np.argsort(-top_scores, axis=1)
+                distances = np.take_along_axis(top_scores, order, axis=1)
+                indices = allowed[np.take_along_axis(top, order, axis=1)]
+            else:
+                # Restrict the search to the documents' chunks inside FAISS. Filtered-out
+                # nodes still take up room in the HNSW beam, so widen it in proportion
+                # to how selective the filter is, up to a cap
+                selector = faiss.IDSelectorBatch(len(allowed), faiss.swig_ptr(allowed))
+                ef = max(ef, min(config.HNSW_FILTER_EF_MAX, search_k * self.index.ntotal // len(allowed)))
+                params = faiss.SearchParametersHNSW(efSearch=ef, sel=selector)
+                distances, indices = self.index.search(queries, search_k, params=params)
+        else:
+            # Get enough results to skip deleted chunks
+            search_k = min(top_k + self._tombstone_count, self.index.ntotal)
+            
+            # Large batches go to the GPU mirror if there is one (GPU flat search
+            # supports k up to 2048)
+            use_gpu = (
+                self._gpu_index is not None
+                and len(queries) >= config.GPU_MIN_BATCH and search_k <= 2048
+            )
+            if use_gpu:
+                distances, indices = self._gpu_index.search(queries, search_k)
+            else:
+                params = faiss.SearchParametersHNSW(efSearch=ef)
+                distances, indices = self.index.search(queries, search_k, params=params)
+        
+        # Mask out the -1 padding HNSW returns when it finds fewer than search_k
+        # neighbors, ids with no metadata row (an index saved without its metadata),
+        # and deleted chunks, for the whole batch at once
+        valid = (indices >= 0) & (indices < len(self._live))
+        valid[valid] = self._live[indices[valid]]
+        
+        # Retrieve metadata for the first top_k valid hits of each query; inner products
+        # of unit vectors are already similarity scores
+        batch_results = []
+        for row_valid, row_indices, row_distances in zip(valid, indices, distances):
+            keep = np.flatnonzero(row_valid)[:top_k]
+            batch_results.append([
+                (self._row(idx), similarity)
+                for idx, similarity in zip(row_indices[keep].tolist(), row_distances[keep].tolist())
+            ])
+        
+        return batch_results
+    
+    def _cache_lookup(
+        self,
+        query_embedding: np.ndarray,
+        signature: tuple
+    ) -> Optional[List[Tuple[Dict, float]]]:
+        """Return cached results for a query within the similarity threshold, if any."""
+        if not self._cache_vals:
+            return None
+        
+        # One matrix-vector product against the cached keys
+        sims = self._cache_keys[:len(self._cache_vals)] @ query_embedding[0]
+        candidates = np.flatnonzero(sims >= config.QUERY_CACHE_THRESHOLD)
+        for i in candidates[np.argsort(-sims[candidates])]:
+            cached_signature, results = self._cache_vals[i]
+            if cached_signature == signature:
+                return list(results)
+        return None
+    
+    def _cache_store(
+        self,
+        query_embedding: np.ndarray,
+        signature: tuple,
+        results: List[Tuple[Dict, float]]
+    ):
+        """Add a query and its results to the cache, evicting the oldest entry when full."""
+        capacity = len(self._cache_keys)
+        if capacity == 0:
+            return
+        
+        slot = self._cache_next
+        self._cache_keys[slot] = query_embedding[0]
+        entry = (signature, list(results))
+        if slot < len(self._cache_vals):
+            self._cache_vals[slot] = entry
+        else:
+            self._cache_vals.append(entry)
+        self._cache_next = (slot + 1) % capacity
+    
+    def _clear_query_cache(self):
+        """Drop cached results once the index contents change."""
+        self._cache_vals = []
+        self._cache_next = 0
     
     def get_chunks_by_doc_id(self, doc_id: str) -> List[Dict]:
         """
@@ -139,59 +565,109 @@ class VectorStore:
         Returns:
             List of chunk metadata
         """
-        return [m for m in self.metadata if m['doc_id'] == doc_id]
+        return [self._row(i) for i in self._doc_vec_ids.get(doc_id, ())]
     
     def delete_document(self, doc_id: str):
         """
         Delete all chunks for a document.
-        Note: FAISS doesn't support deletion, so we rebuild the index.
+        Note: HNSW can't remove vectors, so deleted chunks are tombstoned (their
+        doc_id becomes None and search skips them). The index is only rebuilt
+        once tombstones exceed config.TOMBSTONE_COMPACT_RATIO of it.
         
         Args:
             doc_id: Document ID to delete
         """
-        # Get indices to keep
-        indices_to_keep = [i for i, m in enumerate(self.metadata) if m['doc_id'] != doc_id]
+        ids_to_remove = self._doc_vec_ids.pop(doc_id, [])
         
-        if len(indices_to_keep) == len(self.metadata):
+        if not ids_to_remove:
             print(f"No chunks found for doc_id: {doc_id}")
             return
         
+        # Clear the chunks' data, not just their doc_id; columns still held as Arrow
+        # data are cleared when the store is next saved
+        for col in self._cols.values():
+            if not isinstance(col, _LazyColumn):
+                for i in ids_to_remove:
+                    col[i] = None
+        self._live[ids_to_remove] = False
+        self._tombstone_count += len(ids_to_remove)
+        
+        if self._tombstone_count > config.TOMBSTONE_COMPACT_RATIO * self.index.ntotal:
+            self._compact()
+        
+        self._clear_query_cache()
+        print(f"Deleted chunks for doc_id: {doc_id}. Remaining: {self.index.ntotal - self._tombstone_count}")
+    
+    def _compact(self):
+        """Rebuild the index and metadata without tombstoned chunks."""
+        self._materialize_columns()
+        indices_to_keep = [i for i, d in enumerate(self._cols['doc_id']) if d is not None]
+        
         # Rebuild index with remaining vectors
         if indices_to_keep:
-            # Get embeddings for chunks to keep
-            old_vectors = np.array([self.index.reconstruct(i) for i in indices_to_keep])
+            # Copy all stored vectors out in one call, then keep the surviving rows
+            all_vectors = np.empty((self.index.ntotal, self.embedding_dim), dtype='float32')
+            self.index.reconstruct_n(0, self.index.ntotal, all_vectors)
+            kept_vectors = all_vectors[indices_to_keep]
             
-            # Create new index
-            self.index = faiss.IndexFlatL2(self.embedding_dim)
-            self.index.add(old_vectors.astype('float32'))
+            # Create new index, building the HNSW graph in one batch
+            self.index = self._create_index()
+            self._add_vectors(kept_vectors)
             
             # Update metadata
-            self.metadata = [self.metadata[i] for i in indices_to_keep]
+            self._cols = {
+                name: [col[i] for i in indices_to_keep] for name, col in self._cols.items()
+            }
         else:
             # No chunks left, create empty index
-            self.index = faiss.IndexFlatL2(self.embedding_dim)
-            self.metadata = []
+            self.index = self._create_index()
+            self._cols = {name: [] for name in METADATA_FIELDS}
         
-        print(f"Deleted chunks for doc_id: {doc_id}. Remaining: {self.index.ntotal}")
+        self._tombstone_count = 0
+        self._index_doc_ids()
+        self._sync_gpu_index()
+        print(f"Compacted FAISS index to {self.index.ntotal} vectors")
     
     def save(self):
         """Save the index and metadata to disk."""
         # Save FAISS index
         faiss.write_index(self.index, str(self.index_path))
+        self._index_size_bytes = self.index_path.stat().st_size
         
-        # Save metadata
-        with open(self.metadata_path, 'w', encoding='utf-8') as f:
-            json.dump(self.metadata, f, ensure_ascii=False, indent=2)
+        # Save metadata, removing the other format's file so a stale copy is never loaded
+        if pa is not None:
+            table = pa.Table.from_pydict({
+                name: col.array if isinstance(col, _LazyColumn) else col
+                for name, col in self._cols.items()
+            })
+            if self._tombstone_count:
+                # Deleted chunks keep their row for the index ids, but none of their
+                # data, as in the JSON format's null rows
+                live = pa.array(self._live)
+                table = pa.table({
+                    name: pc.if_else(live, table.column(name), pa.scalar(None, table.column(name).type))
+                    for name in table.column_names
+                })
+            pq.write_table(table, self._parquet_path)
+            self.metadata_path.unlink(missing_ok=True)
+        else:
+            rows = [
+                self._row(i) if doc_id is not None else None
+                for i, doc_id in enumerate(self._cols['doc_id'])
+            ]
+            # Compact output: no indentation or padding after separators
+            with open(self.metadata_path, 'w', encoding='utf-8') as f:
+                json.dump(rows, f, ensure_ascii=False, separators=(',', ':'))
+            self._parquet_path.unlink(missing_ok=True)
         
         print(f"Saved vector store with {self.index.ntotal} vectors")
     
     def get_stats(self) -> Dict:
         """Get statistics about the vector store."""
-        doc_ids = set(m['doc_id'] for m in self.metadata)
-        
+        # The doc_id map holds exactly the documents that still have chunks
         return {
-            'total_chunks': self.index.ntotal,
-            'total_documents': len(doc_ids),
+            'total_chunks': self.index.ntotal - self._tombstone_count,
+            'total_documents': len(self._doc_vec_ids),
             'embedding_dim': self.embedding_dim,
-            'index_size_mb': self.index_path.stat().st_size / (1024 * 1024) if self.index_path.exists() else 0
+            'index_size_mb': self._index_size_bytes / (1024 * 1024)
         }
@@ -2,16 +2,155 @@
 Explainable AI (XAI) module for generating human-readable explanations.
 Provides transparency and traceability for claim decisions.
 """
-from typing import Dict, List
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional
 from claim_models import DecisionExplanation, ClaimStatus, ClaimDecision
 
 
+# Explanation result types. Slotted, so each explanation is a handful of compact
+# objects; they become plain dicts only when serialized with to_dict().
+
+class _SlotsToDict:
+    """Mixin converting a slotted result type to a dict in field order"""
+    __slots__ = ()
+    
+    def to_dict(self) -> Dict:
+        # Reads the slots directly; dataclasses.asdict deep-copies every value and is much slower
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+@dataclass
+class DecisionFactor(_SlotsToDict):
+    """One factor behind a decision, with its display value"""
+    __slots__ = ("factor", "value", "description")
+    factor: str
+    value: str
+    description: str
+
+
+@dataclass
+class Reasoning:
+    """Primary reason for a decision and the factors supporting it"""
+    __slots__ = ("primary_reason", "decision_factors")
+    primary_reason: str
+    decision_factors: List[DecisionFactor]
+    
+    def to_dict(self) -> Dict:
+        """Convert to a dict, including the nested result types"""
+        return {
+            "primary_reason": self.primary_reason,
+            "decision_factors": [factor.to_dict() for factor in self.decision_factors]
+        }
+
+
+@dataclass
+class ConfidenceLevel(_SlotsToDict):
+    """User-facing interpretation of a confidence score"""
+    __slots__ = ("level", "score", "description")
+    level: str
+    score: str
+    description: str
+
+
+@dataclass
+class CoverageChart(_SlotsToDict):
+    """Amounts for the coverage usage chart"""
+    __slots__ = ("total_coverage", "claimed", "approved", "remaining", "percentage_used")
+    total_coverage: float
+    claimed: float
+    approved: float
+    remaining: float
+    percentage_used: float
+
+
+@dataclass
+class StatusIndicator(_SlotsToDict):
+    """Status badge shown next to a decision"""
+    __slots__ = ("status", "color", "icon")
+    status: str
+    color: str
+    icon: str
+
+
+@dataclass
+class VisualBreakdown:
+    """Data for the visual representation of a decision"""
+    __slots__ = ("coverage_chart", "status_indicator")
+    coverage_chart: CoverageChart
+    status_indicator: StatusIndicator
+    
+    def to_dict(self) -> Dict:
+        """Convert to a dict, including the nested result types"""
+        return {
+            "coverage_chart": self.coverage_chart.to_dict(),
+            "status_indicator": self.status_indicator.to_dict()
+        }
+
+
+@dataclass
+class DetailedExplanation:
+    """Complete user-facing explanation of a claim decision"""
+    __slots__ = (
+        "decision_summary", "reasoning", "policy_clauses", "calculation_breakdown",
+        "next_steps", "confidence_level", "visual_breakdown", "natural_language"
+    )
+    decision_summary: str
+    reasoning: Reasoning
+    policy_clauses: List[Dict]
+    calculation_breakdown: List[Dict]
+    next_steps: List[str]
+    confidence_level: ConfidenceLevel
+    visual_breakdown: VisualBreakdown
+    natural_language: Optional[str]
+    
+    def to_dict(self) -> Dict:
+        """Convert to a JSON-serializable dict (natural_language only when generated)"""
+        result = {
+            "decision_summary": self.decision_summary,
+            "reasoning": self.reasoning.to_dict(),
+            "policy_clauses": self.policy_clauses,
+            "calculation_breakdown": self.calculation_breakdown,
+            "next_steps": self.next_steps,
+            "confidence_level": self.confidence_level.to_dict(),
+            "visual_breakdown": self.visual_breakdown.to_dict()
+        }
+        if self.natural_language is not None:
+            result["natural_language"] = self.natural_language
+        return result
+
+
 class XAIExplainer:
     """
     Generates human-readable explanations for claim decisions.
     Ensures transparency and builds user trust.
     """
     
+    # (minimum score, level, description), highest threshold first; scores below
+    # every threshold (or NaN) fall back to the last entry
+    _CONF_TABLE = (
+        (0.9, "Very High", "This decision is based on clear policy rules with high certainty"),
+        (0.8, "High", "This decision is well-supported by policy terms"),
+        (0.7, "Medium", "This decision may require additional review"),
+        (0.0, "Low", "This decision has some uncertainty and may be reviewed"),
+    )
+    
+    # Status display lookups, built once instead of on every call
+    _STATUS_COLORS = {
+        ClaimStatus.APPROVED: "#10b981",  # Green
+        ClaimStatus.REJECTED: "#ef4444",  # Red
+        ClaimStatus.UNDER_REVIEW: "#f59e0b",  # Orange
+        ClaimStatus.PENDING: "#6b7280"  # Gray
+    }
+    _STATUS_ICONS = {
+        ClaimStatus.APPROVED: "✅",
+        ClaimStatus.REJECTED: "❌",
+        ClaimStatus.UNDER_REVIEW: "⏳",
+        ClaimStatus.PENDING: "📋"
+    }
+    # Distinct decision signatures kept in the LLM explanation cache
+    _LLM_CACHE_SIZE = 4096
+    
     def __init__(self, llm_generator=None):
         """
         Initialize XAI explainer.
@@ -20,8 +159,10 @@ class XAIExplainer:
             llm_generator: Optional LLM for generating natural language explanations
         """
         self.llm_generator = llm_generator
+        # Memoized per instance, since responses depend on this explainer's llm_generator
+        self._llm_explain_cached = lru_cache(maxsize=self._LLM_CACHE_SIZE)(self._llm_explain)
     
-    def generate_detailed_explanation(self, decision: ClaimDecision) -> Dict:
+    def generate_detailed_explanation(self, decision: ClaimDecision) -> DetailedExplanation:
         """
         Generate a detailed, user-friendly explanation of the decision.
         
@@ -29,26 +170,50 @@ class XAIExplainer:
             decision: ClaimDecision object
             
         Returns:
-            Dictionary with detailed explanation components
+            DetailedExplanation with the explanation components (use to_dict() for JSON)
         """
         explanation = decision.explanation
         
-        # Build structured explanation
-        detailed_explanation = {
-            "decision_summary": self._create_decision_summary(decision),
-            "reasoning": self._create_reasoning(decision),
-            "policy_clauses": self._format_policy_clauses(explanation.relevant_clauses),
-            "calculation_breakdown": self._format_calculations(explanation.calculation_details),
-            "next_steps": self._suggest_next_steps(decision),
-            "confidence_level": self._interpret_confidence(explanation.confidence_score),
-            "visual_breakdown": self._create_visual_data(decision)
-        }
+        # Calculation values appear in both the reasoning and the breakdown; format them once
+        display_values = self._format_calculation_values(explanation.calculation_details)
         
-        # Optionally enhance with LLM
-        if self.llm_generator:
-            detailed_explanation["natural_language"] = self._generate_llm_explanation(decision)
+        # Build structured explanation, optionally enhanced with LLM
+        return DetailedExplanation(
+            decision_summary=self._create_decision_summary(decision),
+            reasoning=self._create_reasoning(decision, display_values),
+            policy_clauses=self._format_policy_clauses(explanation.relevant_clauses),
+            calculation_breakdown=self._format_calculations(explanation.calculation_details, display_values),
+            next_steps=self._suggest_next_steps(decision),
+            confidence_level=self._interpret_confidence(explanation.confidence_score),
+            visual_breakdown=self._create_visual_data(decision),
+            natural_language=self._generate_llm_explanation(decision) if self.llm_generator else None
+        )
+    
+    def generate_detailed_explanations(self, decisions: List[ClaimDecision]) -> List[DetailedExplanation]:
+        """
+        Generate detailed explanations for a batch of decisions (e.g. a claims audit).
         
-        return detailed_explanation
+        Args:
+            decisions: ClaimDecision objects
+            
+        Returns:
+            List of DetailedExplanation objects, in the same order as the decisions
+        """
+        generate = self.generate_detailed_explanation
+        return [generate(decision) for decision in decisions]
+    
+    def _format_calculation_values(self, calc: Dict) -> Dict[str, str]:
+        """Format each calculation value for display once"""
+        formatted = {}
+        
+        for key in ("claimed_amount", "coverage_limit", "threshold_amount"):
+            if key in calc:
+                formatted[key] = f"₹{calc[key]:,.2f}"
+        
+        if "percentage_of_limit" in calc:
+            formatted["percentage_of_limit"] = f"{calc['percentage_of_limit']:.1f}%"
+        
+        return formatted
     
     def _create_decision_summary(self, decision: ClaimDecision) -> str:
         """Create a one-line summary of the decision"""
@@ -59,41 +224,37 @@ class XAIExplainer:
         else:  # UNDER_REVIEW
             return f"⏳ Your claim of ₹{decision.claimed_amount:,.2f} is UNDER REVIEW by our claims team."
     
-    def _create_reasoning(self, decision: ClaimDecision) -> Dict:
-        """Create detailed reasoning breakdown"""
+    def _create_reasoning(self, decision: ClaimDecision, display_values: Dict[str, str]) -> Reasoning:
+        """Create detailed reasoning breakdown from the pre-formatted calculation values"""
         explanation = decision.explanation
-        
-        reasoning = {
-            "primary_reason": explanation.reason,
-            "decision_factors": []
-        }
+        decision_factors = []
         
         # Add specific factors based on calculation details
         calc = explanation.calculation_details
         
         if "coverage_limit" in calc:
-            reasoning["decision_factors"].append({
-                "factor": "Coverage Limit",
-                "value": f"₹{calc['coverage_limit']:,.2f}",
-                "description": "Maximum amount covered under your policy"
-            })
+            decision_factors.append(DecisionFactor(
+                factor="Coverage Limit",
+                value=display_values["coverage_limit"],
+                description="Maximum amount covered under your policy"
+            ))
         
         if "percentage_of_limit" in calc:
-            percentage = calc["percentage_of_limit"]
-            reasoning["decision_factors"].append({
-                "factor": "Claim Percentage",
-                "value": f"{percentage:.1f}%",
-                "description": f"Your claim represents {percentage:.1f}% of your total coverage"
-            })
+            percentage = display_values["percentage_of_limit"]
+            decision_factors.append(DecisionFactor(
+                factor="Claim Percentage",
+                value=percentage,
+                description=f"Your claim represents {percentage} of your total coverage"
+            ))
         
         if "threshold_amount" in calc:
-            reasoning["decision_factors"].append({
-                "factor": "Auto-Approval Threshold",
-                "value": f"₹{calc['threshold_amount']:,.2f}",
-                "description": "Claims below this amount are automatically approved"
-            })
+            decision_factors.append(DecisionFactor(
+                factor="Auto-Approval Threshold",
+                value=display_values["threshold_amount"],
+                description="Claims below this amount are automatically approved"
+            ))
         
-        return reasoning
+        return Reasoning(primary_reason=explanation.reason, decision_factors=decision_factors)
     
     def _format_policy_clauses(self, clauses: List[str]) -> List[Dict]:
         """Format policy clauses for display"""
@@ -108,35 +269,35 @@ class XAIExplainer:
         
         return formatted_clauses
     
-    def _format_calculations(self, calculations: Dict) -> List[Dict]:
-        """Format calculation details for display"""
+    def _format_calculations(self, calculations: Dict, display_values: Dict[str, str]) -> List[Dict]:
+        """Format calculation details for display from the pre-formatted values"""
         formatted = []
         
         if "claimed_amount" in calculations:
             formatted.append({
                 "item": "Claimed Amount",
-                "value": f"₹{calculations['claimed_amount']:,.2f}",
+                "value": display_values["claimed_amount"],
                 "type": "input"
             })
         
         if "coverage_limit" in calculations:
             formatted.append({
                 "item": "Coverage Limit",
-                "value": f"₹{calculations['coverage_limit']:,.2f}",
+                "value": display_values["coverage_limit"],
                 "type": "policy"
             })
         
         if "threshold_amount" in calculations:
             formatted.append({
                 "item": "Approval Threshold (80%)",
-                "value": f"₹{calculations['threshold_amount']:,.2f}",
+                "value": display_values["threshold_amount"],
                 "type": "threshold"
             })
         
         if "percentage_of_limit" in calculations:
             formatted.append({
                 "item": "Percentage of Coverage Used",
-                "value": f"{calculations['percentage_of_limit']:.1f}%",
+                "value": display_values["percentage_of_limit"],
                 "type": "calculation"
             })
         
@@ -167,28 +328,21 @@ class XAIExplainer:
                 f"Track your claim status using ID: {decision.claim_id}"
             ]
     
-    def _interpret_confidence(self, confidence_score: float) -> Dict:
+    def _interpret_confidence(self, confidence_score: float) -> ConfidenceLevel:
         """Interpret confidence score for users"""
-        if confidence_score >= 0.9:
-            level = "Very High"
-            description = "This decision is based on clear policy rules with high certainty"
-        elif confidence_score >= 0.8:
-            level = "High"
-            description = "This decision is well-supported by policy terms"
-        elif confidence_score >= 0.7:
-            level = "Medium"
-            description = "This decision may require additional review"
-        else:
-            level = "Low"
-            description = "This decision has some uncertainty and may be reviewed"
+        level, description = next(
+            ((level, description) for threshold, level, description in self._CONF_TABLE
+             if confidence_score >= threshold),
+            self._CONF_TABLE[-1][1:]
+        )
         
-        return {
-            "level": level,
-            "score": f"{confidence_score * 100:.0f}%",
-            "description": description
-        }
+        return ConfidenceLevel(
+            level=level,
+            score=f"{confidence_score * 100:.0f}%",
+            description=description
+        )
     
-    def _create_visual_data(self, decision: ClaimDecision) -> Dict:
+    def _create_visual_data(self, decision: ClaimDecision) -> VisualBreakdown:
         """Create data for visual representation"""
         calc = decision.explanation.calculation_details
         
@@ -196,40 +350,28 @@ class XAIExplainer:
         claimed_amount = calc.get("claimed_amount", 0)
         approved_amount = decision.approved_amount
         
-        return {
-            "coverage_chart": {
-                "total_coverage": coverage_limit,
-                "claimed": claimed_amount,
-                "approved": approved_amount,
-                "remaining": max(0, coverage_limit - approved_amount),
-                "percentage_used": (approved_amount / coverage_limit * 100) if coverage_limit > 0 else 0
-            },
-            "status_indicator": {
-                "status": decision.decision.value,
-                "color": self._get_status_color(decision.decision),
-                "icon": self._get_status_icon(decision.decision)
-            }
-        }
+        return VisualBreakdown(
+            coverage_chart=CoverageChart(
+                total_coverage=coverage_limit,
+                claimed=claimed_amount,
+                approved=approved_amount,
+                remaining=max(0, coverage_limit - approved_amount),
+                percentage_used=(approved_amount / coverage_limit * 100) if coverage_limit > 0 else 0
+            ),
+            status_indicator=StatusIndicator(
+                status=decision.decision.value,
+                color=self._get_status_color(decision.decision),
+                icon=self._get_status_icon(decision.decision)
+            )
+        )
     
     def _get_status_color(self, status: ClaimStatus) -> str:
         """Get color code for status"""
-        colors = {
-            ClaimStatus.APPROVED: "#10b981",  # Green
-            ClaimStatus.REJECTED: "#ef4444",  # Red
-            ClaimStatus.UNDER_REVIEW: "#f59e0b",  # Orange
-            ClaimStatus.PENDING: "#6b7280"  # Gray
-        }
-        return colors.get(status, "#6b7280")
+        return self._STATUS_COLORS.get(status, "#6b7280")
     
     def _get_status_icon(self, status: ClaimStatus) -> str:
         """Get icon for status"""
-        icons = {
-            ClaimStatus.APPROVED: "✅",
-            ClaimStatus.REJECTED: "❌",
-            ClaimStatus.UNDER_REVIEW: "⏳",
-            ClaimStatus.PENDING: "📋"
-        }
-        return icons.get(status, "📋")
+        return self._STATUS_ICONS.get(status, "📋")
     
     def _generate_llm_explanation(self, decision: ClaimDecision) -> str:
         """Generate natural language explanation using LLM (optional)"""
@@ -237,23 +379,44 @@ class XAIExplainer:
             return decision.explanation.reason
         
         try:
-            prompt = f"""
+            # Keyed on the amounts as they appear in the prompt, so a cached response
+            # never quotes another claim's figures
+            return self._llm_explain_cached(
+                decision.decision.value,
+                f"{decision.claimed_amount:,.2f}",
+                f"{decision.approved_amount:,.2f}",
+                decision.explanation.reason
+            )
+        except Exception as e:
+            print(f"Error generating LLM explanation: {e}")
+            return decision.explanation.reason
+    
+    def _llm_explain(self, decision_type: str, claimed: str, approved: str, reason: str) -> str:
+        """
+        Call the LLM for one decision signature. Failures raise, so they are not cached.
+        
+        Args:
+            decision_type: Decision status value
+            claimed: Formatted claimed amount
+            approved: Formatted approved amount
+            reason: Decision reason
+            
+        Returns:
+            LLM response text
+        """
+        prompt = f"""
             Explain this insurance claim decision in simple, friendly language:
             
-            Decision: {decision.decision.value}
-            Claimed Amount: ₹{decision.claimed_amount:,.2f}
-            Approved Amount: ₹{decision.approved_amount:,.2f}
-            Reason: {decision.explanation.reason}
+            Decision: {decision_type}
+            Claimed Amount: ₹{claimed}
+            Approved Amount: ₹{approved}
+            Reason: {reason}
             
             Make it conversational and empathetic. Keep it under 100 words.
             """
-            
-            # Use existing LLM generator if available
-            response = self.llm_generator(prompt)
-            return response
-        except Exception as e:
-            print(f"Error generating LLM explanation: {e}")
-            return decision.explanation.reason
+        
+        # Use existing LLM generator if available
+        return self.llm_generator(prompt)
     
     def generate_audit_trail(self, decision: ClaimDecision) -> Dict:
         """Generate audit trail for compliance and traceability"""
@@ -1,494 +1,692 @@
 """
 Generate sample health insurance documents for demo purposes
 """
+from reportlab import Version as _REPORTLAB_VERSION
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib import colors
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_CENTER, TA_RIGHT, TA_LEFT
 from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+import argparse
+import hashlib
+import multiprocessing
 import os
 
-# Create output directory
-os.makedirs('output', exist_ok=True)
+# Shared styles, built once at import instead of inside every generator
+_STYLES = getSampleStyleSheet()
 
-def create_health_insurance_policy():
-    """Create a sample health insurance policy document"""
-    filename = 'output/Health_Insurance_Policy.pdf'
-    doc = SimpleDocTemplate(filename, pagesize=letter)
-    story = []
-    styles = getSampleStyleSheet()
-    
-    # Custom styles
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        textColor=colors.HexColor('#1a237e'),
-        spaceAfter=30,
-        alignment=TA_CENTER
-    )
-    
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=14,
-        textColor=colors.HexColor('#283593'),
-        spaceAfter=12,
-        spaceBefore=12
-    )
-    
+_C_INDIGO_DARK = colors.HexColor('#1a237e')
+_C_INDIGO = colors.HexColor('#283593')
+_C_RED = colors.HexColor('#c62828')
+_C_TEAL = colors.HexColor('#00695c')
+_C_BLUE_MID = colors.HexColor('#1565c0')
+_C_BLUE_LIGHT = colors.HexColor('#e3f2fd')
+_C_RED_LIGHT = colors.HexColor('#ffebee')
+_C_TEAL_LIGHT = colors.HexColor('#e0f2f1')
+_C_GREY_LIGHT = colors.HexColor('#f5f5f5')
+
+_TITLE_POLICY = ParagraphStyle(
+    'CustomTitle',
+    parent=_STYLES['Heading1'],
+    fontSize=24,
+    textColor=_C_INDIGO_DARK,
+    spaceAfter=30,
+    alignment=TA_CENTER
+)
+_HEADING_POLICY = ParagraphStyle(
+    'CustomHeading',
+    parent=_STYLES['Heading2'],
+    fontSize=14,
+    textColor=_C_INDIGO,
+    spaceAfter=12,
+    spaceBefore=12
+)
+_FOOTER_POLICY = ParagraphStyle('Footer', parent=_STYLES['Normal'], fontSize=8, textColor=colors.grey)
+
+_TITLE_CLAIM = ParagraphStyle(
+    'CustomTitle',
+    parent=_STYLES['Heading1'],
+    fontSize=20,
+    textColor=_C_RED,
+    spaceAfter=20,
+    alignment=TA_CENTER
+)
+_HEADING_CLAIM = ParagraphStyle(
+    'CustomHeading',
+    parent=_STYLES['Heading2'],
+    fontSize=14,
+    textColor=_C_RED,
+    spaceAfter=12
+)
+
+_TITLE_BILL = ParagraphStyle(
+    'CustomTitle',
+    parent=_STYLES['Heading1'],
+    fontSize=22,
+    textColor=_C_TEAL,
+    spaceAfter=10,
+    alignment=TA_CENTER
+)
+_BILL_HEADER = ParagraphStyle('BillTitle', parent=_STYLES['Heading2'],
+                              fontSize=16, textColor=_C_TEAL, alignment=TA_CENTER)
+_HEADING_BILL = ParagraphStyle(
+    'CustomHeading',
+    parent=_STYLES['Heading2'],
+    fontSize=12,
+    textColor=_C_TEAL,
+    spaceAfter=10
+)
+_FOOTER_BILL = ParagraphStyle('Footer', parent=_STYLES['Normal'], fontSize=9,
+                              textColor=colors.grey, alignment=TA_CENTER)
+
+_TITLE_DISCHARGE = ParagraphStyle(
+    'CustomTitle',
+    parent=_STYLES['Heading1'],
+    fontSize=18,
+    textColor=_C_BLUE_MID,
+    spaceAfter=20,
+    alignment=TA_CENTER
+)
+_HEADING_DISCHARGE = ParagraphStyle(
+    'CustomHeading',
+    parent=_STYLES['Heading2'],
+    fontSize=12,
+    textColor=_C_BLUE_MID,
+    spaceAfter=8,
+    spaceBefore=10
+)
+_SIGNATURE_STYLE = ParagraphStyle('Sign', parent=_STYLES['Normal'], fontSize=11, fontName='Helvetica-Bold')
+
+# Centered body text (Normal is already 10pt)
+_CENTER_SMALL = ParagraphStyle('Center', parent=_STYLES['Normal'], alignment=TA_CENTER, fontSize=10)
+
+# Table style commands, kept as plain tuples so the module imports without
+# reportlab.platypus; _table_style turns each into one shared TableStyle on first use
+_POLICY_TABLE_STYLE = (
+    ('BACKGROUND', (0, 0), (0, -1), _C_BLUE_LIGHT),
+    ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    ('TOPPADDING', (0, 0), (-1, -1), 8),
+    ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+)
+
+_COVERAGE_TABLE_STYLE = (
+    ('BACKGROUND', (0, 0), (-1, 0), _C_INDIGO_DARK),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    ('TOPPADDING', (0, 0), (-1, -1), 8),
+    ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), (colors.white, _C_GREY_LIGHT)),
+)
+
+_CLAIM_TABLE_STYLE = (
+    ('BACKGROUND', (0, 0), (0, -1), _C_RED_LIGHT),
+    ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    ('TOPPADDING', (0, 0), (-1, -1), 8),
+    ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+)
+
+_BILL_TABLE_STYLE = (
+    ('BACKGROUND', (0, 0), (-1, 0), _C_RED),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    ('TOPPADDING', (0, 0), (-1, -1), 8),
+    ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+    ('LINEABOVE', (0, -1), (-1, -1), 2, colors.black),
+    ('BACKGROUND', (0, -1), (-1, -1), _C_RED_LIGHT),
+)
+
+_SIG_TABLE_STYLE = (
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+)
+
+_PATIENT_TABLE_STYLE = (
+    ('BACKGROUND', (0, 0), (0, -1), _C_TEAL_LIGHT),
+    ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ('TOPPADDING', (0, 0), (-1, -1), 6),
+    ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+)
+
+_DETAILED_TABLE_STYLE = (
+    ('BACKGROUND', (0, 0), (-1, 0), _C_TEAL),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (0, -1), 'CENTER'),
+    ('ALIGN', (2, 0), (-1, -1), 'RIGHT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ('TOPPADDING', (0, 0), (-1, -1), 6),
+    ('GRID', (0, 0), (-1, -3), 1, colors.grey),
+    ('LINEABOVE', (0, -3), (-1, -3), 2, colors.black),
+    ('LINEABOVE', (0, -1), (-1, -1), 2, colors.black),
+    ('BACKGROUND', (0, -1), (-1, -1), _C_TEAL_LIGHT),
+    ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, -1), (-1, -1), 11),
+)
+
+_DISCHARGE_PATIENT_STYLE = (
+    ('BACKGROUND', (0, 0), (0, -1), _C_BLUE_LIGHT),
+    ('BACKGROUND', (2, 0), (2, -1), _C_BLUE_LIGHT),
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTNAME', (2, 0), (2, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ('TOPPADDING', (0, 0), (-1, -1), 6),
+    ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+)
+
+# Table contents. Table copies its data into fresh row lists (normalizeData),
+# so these immutable constants are never modified by a build
+_POLICY_DATA = (
+    ('Policy Number:', 'POL-2024-MH-789456'),
+    ('Policy Holder:', 'Rajesh Kumar Sharma'),
+    ('Date of Birth:', '15/03/1985'),
+    ('Policy Issue Date:', '01/01/2024'),
+    ('Policy Expiry Date:', '31/12/2024'),
+    ('Sum Assured:', '₹5,00,000'),
+    ('Premium Amount:', '₹15,450 per annum'),
+    ('Policy Type:', 'Individual Health Insurance'),
+)
+_POLICY_COLS = (2.5*inch, 4*inch)
+
+_COVERAGE_DATA = (
+    ('Coverage Type', 'Limit'),
+    ('Hospitalization Expenses', '₹5,00,000'),
+    ('Pre-hospitalization (60 days)', '₹25,000'),
+    ('Post-hospitalization (90 days)', '₹25,000'),
+    ('Ambulance Charges', '₹2,000 per hospitalization'),
+    ('Day Care Procedures', 'Covered'),
+    ('Room Rent', '₹3,000 per day (max)'),
+)
+_COVERAGE_COLS = (4*inch, 2.5*inch)
+
+_CLAIM_DATA = (
+    ('Claim Number:', 'CLM-2024-00567'),
+    ('Policy Number:', 'POL-2024-MH-789456'),
+    ('Claim Date:', '15/11/2024'),
+    ('Policy Holder:', 'Rajesh Kumar Sharma'),
+    ('Patient Name:', 'Rajesh Kumar Sharma'),
+    ('Hospital Name:', 'Apollo Hospital, Mumbai'),
+    ('Date of Admission:', '10/11/2024'),
+    ('Date of Discharge:', '13/11/2024'),
+    ('Diagnosis:', 'Acute Appendicitis'),
+    ('Treatment:', 'Appendectomy (Laparoscopic)'),
+    ('Total Claim Amount:', '₹1,25,000'),
+)
+_CLAIM_COLS = (2.5*inch, 4*inch)
+
+_CLAIM_BILL_DATA = (
+    ('Description', 'Amount (₹)'),
+    ('Room Charges (3 days @ ₹2,500/day)', '7,500'),
+    ('Surgery Charges', '45,000'),
+    ('Surgeon Fees', '25,000'),
+    ('Anesthesia Charges', '8,000'),
+    ('Medicines and Consumables', '15,500'),
+    ('Diagnostic Tests', '12,000'),
+    ('Nursing Charges', '6,000'),
+    ('Other Hospital Charges', '6,000'),
+    ('TOTAL', '₹1,25,000'),
+)
+_CLAIM_BILL_COLS = (4.5*inch, 2*inch)
+
+_SIG_DATA = (
+    ('Signature:', '_______________________'),
+    ('Date:', '15/11/2024'),
+    ('Place:', 'Mumbai'),
+)
+_SIG_COLS = (1.5*inch, 3*inch)
+
+_BILL_PATIENT_DATA = (
+    ('Bill Number:', 'APL-MUM-2024-5678'),
+    ('Patient Name:', 'Rajesh Kumar Sharma'),
+    ('Age/Gender:', '39 Years / Male'),
+    ('Patient ID:', 'PAT-456789'),
+    ('Admission Date:', '10/11/2024 - 08:30 AM'),
+    ('Discharge Date:', '13/11/2024 - 11:00 AM'),
+    ('Total Days:', '3 Days'),
+    ('Doctor:', 'Dr. Amit Patel (General Surgeon)'),
+    ('Department:', 'General Surgery'),
+)
+_BILL_PATIENT_COLS = (2*inch, 4.5*inch)
+
+_DETAILED_BILL_DATA = (
+    ('S.No', 'Description', 'Quantity', 'Rate (₹)', 'Amount (₹)'),
+    ('1', 'Room Charges (Semi-Private AC)', '3 days', '2,500', '7,500'),
+    ('2', 'Laparoscopic Appendectomy', '1', '45,000', '45,000'),
+    ('3', 'Surgeon Professional Fees', '1', '25,000', '25,000'),
+    ('4', 'Anesthesia Charges', '1', '8,000', '8,000'),
+    ('5', 'OT Charges', '1', '12,000', '12,000'),
+    ('6', 'Medicines', '-', '-', '15,500'),
+    ('7', 'Injections and IV Fluids', '-', '-', '8,500'),
+    ('8', 'Blood Tests (CBC, LFT, etc.)', '-', '-', '3,500'),
+    ('9', 'Ultrasound Abdomen', '1', '2,000', '2,000'),
+    ('10', 'X-Ray Chest', '1', '800', '800'),
+    ('11', 'ECG', '1', '500', '500'),
+    ('12', 'Nursing Charges', '3 days', '2,000', '6,000'),
+    ('13', 'Consumables', '-', '-', '4,200'),
+    ('14', 'Registration Charges', '1', '500', '500'),
+    ('', '', '', 'SUB-TOTAL:', '₹1,39,000'),
+    ('', '', '', 'Hospital Discount (10%):', '-₹14,000'),
+    ('', '', '', 'TOTAL PAYABLE:', '₹1,25,000'),
+)
+_DETAILED_BILL_COLS = (0.5*inch, 3*inch, 1*inch, 1*inch, 1.5*inch)
+
+_DISCHARGE_PATIENT_DATA = (
+    ('Patient Name:', 'Rajesh Kumar Sharma', 'Age/Gender:', '39 Yrs / Male'),
+    ('Patient ID:', 'PAT-456789', 'Admission Date:', '10/11/2024'),
+    ('Discharge Date:', '13/11/2024', 'Total Stay:', '3 Days'),
+)
+_DISCHARGE_PATIENT_COLS = (1.5*inch, 2*inch, 1.5*inch, 1.5*inch)
+
+# Body text blocks
+_DECLARATION_HTML = """
+    I hereby declare that the information provided above is true and correct to the best of my knowledge. 
+    I understand that any false information may result in rejection of this claim.
+    """
+
+_PAYMENT_HTML = """
+    <b>Amount Paid:</b> ₹1,25,000<br/>
+    <b>Payment Mode:</b> Insurance Claim (SecureHealth Insurance)<br/>
+    <b>Payment Date:</b> 13/11/2024<br/>
+    <b>Status:</b> PAID
+    """
+
+_CLINICAL_HTML = """
+    Patient presented to emergency department with complaints of severe abdominal pain in right lower quadrant 
+    for 12 hours, associated with nausea and vomiting. On examination, patient was febrile (101.2°F) with 
+    tenderness and guarding in right iliac fossa. McBurney's point tenderness was positive. Blood investigations 
+    showed elevated WBC count (14,500/cumm). Ultrasound abdomen confirmed acute appendicitis. Patient was 
+    taken up for emergency laparoscopic appendectomy. Procedure was uneventful. Post-operative recovery was 
+    satisfactory.
+    """
+
+# Numbered lists, one Paragraph per item: a single paragraph joined with <br/>
+# takes ReportLab's slower line-breaking path and wraps about 3x slower
+_EXCLUSION_ITEMS = (
+    "1. Pre-existing diseases (covered after 2 years)",
+    "2. Cosmetic or plastic surgery",
+    "3. Dental treatment (unless due to accident)",
+    "4. Maternity expenses",
+    "5. Treatment outside India",
+    "6. Self-inflicted injuries",
+)
+
+_MEDICATION_ITEMS = (
+    "1. Tab. Amoxicillin + Clavulanic Acid 625mg - TDS for 5 days",
+    "2. Tab. Diclofenac 50mg - SOS for pain",
+    "3. Tab. Pantoprazole 40mg - OD for 7 days",
+    "4. Syrup Lactulose 15ml - HS for 5 days",
+)
+
+_ADVICE_ITEMS = (
+    "1. Keep surgical wound clean and dry",
+    "2. Avoid heavy lifting for 2 weeks",
+    "3. Light diet for 3-4 days, then normal diet",
+    "4. Follow-up after 7 days for suture removal",
+    "5. Report immediately if fever, wound discharge, or severe pain",
+)
+
+# Paragraph parses its markup into style runs (frags) on construction, but
+# platypus keeps layout state on the Paragraph itself; so the parse is cached
+# and each build gets a new Paragraph made from it
+@lru_cache(maxsize=64)
+def _parsed(text, style):
+    """Cleaned text, style and frags of a static paragraph, parsed once"""
+    from reportlab.platypus import Paragraph
+    para = Paragraph(text, style)
+    return para.text, para.style, tuple(para.frags)
+
+def _para(text, style):
+    """New Paragraph for static text, without parsing its markup again"""
+    from reportlab.platypus import Paragraph
+    text, style, frags = _parsed(text, style)
+    return Paragraph(text, style, frags=list(frags))
+
+# TableStyle only holds its commands and Table.setStyle reads them without
+# modifying the style, so one instance can style every build
+@lru_cache(maxsize=16)
+def _table_style(commands):
+    """TableStyle for a command tuple, built on first use"""
+    from reportlab.platypus import TableStyle
+    return TableStyle(commands)
+
+# Document layout as data: each document is a list of sections that build
+# their flowables, rendered by a single function
+
+@dataclass(frozen=True)
+class Text:
+    """Paragraph section (headings and body text)"""
+    text: str
+    style: ParagraphStyle
+    
+    def build(self):
+        return _para(self.text, self.style)
+
+@dataclass(frozen=True)
+class Grid:
+    """Table section; a new Table per build, since layout state lives on the Table"""
+    data: tuple
+    col_widths: tuple
+    style: tuple
+    
+    def build(self):
+        from reportlab.platypus import Table
+        return Table(self.data, colWidths=self.col_widths, style=_table_style(self.style))
+
+@dataclass(frozen=True)
+class Gap:
+    """Vertical space section; a new Spacer per build, since platypus marks a flowable it moves to the next page"""
+    height: float
+    
+    def build(self):
+        from reportlab.platypus import Spacer
+        return Spacer(1, self.height)
+
+@dataclass(frozen=True)
+class DocSpec:
+    """One output document: its file name and its sections in page order"""
+    filename: str
+    sections: tuple
+
+# The documents are built with invariant=1, so their bytes depend only on this
+# script and the ReportLab version; any edit here invalidates every cached PDF
+with open(__file__, 'rb') as _src:
+    _BUILD_KEY = hashlib.blake2b(_src.read() + _REPORTLAB_VERSION.encode(), digest_size=16).hexdigest()
+
+def _key_path(filename):
+    """Where the build key of an output PDF is recorded"""
+    folder, name = os.path.split(filename)
+    return os.path.join(folder, '.cache', os.path.splitext(name)[0] + '.key')
+
+def _is_current(filename):
+    """True if the PDF exists and was built from the current script"""
+    try:
+        with open(_key_path(filename)) as f:
+            return f.read() == _BUILD_KEY and os.path.exists(filename)
+    except OSError:
+        return False
+
+# Compressing page streams costs ~0.4 ms per run but halves the PDF sizes; pinned
+# so a local reportlab settings file can't change the output bytes
+_PAGE_COMPRESSION = 1
+
+def render(spec, force=False):
+    """Build the PDF described by a DocSpec, unless an up-to-date copy exists"""
+    # The create_* wrappers may be called after a plain import, without __main__
+    # having created the output directory
+    os.makedirs(os.path.dirname(spec.filename), exist_ok=True)
+    
+    if not force and _is_current(spec.filename):
+        print(f"✓ Cached: {spec.filename}")
+        return
+    
+    # reportlab.platypus is imported on first render rather than at module import
+    from reportlab.platypus import SimpleDocTemplate
+    
+    doc = SimpleDocTemplate(spec.filename, pagesize=letter, invariant=1, pageCompression=_PAGE_COMPRESSION)
+    doc.build([section.build() for section in spec.sections])
+    
+    # Record the key only after the PDF is written, and atomically, so an
+    # interrupted build is never mistaken for a current one
+    key_path = _key_path(spec.filename)
+    os.makedirs(os.path.dirname(key_path), exist_ok=True)
+    tmp_path = f"{key_path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w') as f:
+        f.write(_BUILD_KEY)
+    os.replace(tmp_path, key_path)
+    print(f"✓ Created: {spec.filename}")
+
+# Standard vertical gaps
+_SP_10 = Gap(0.1*inch)
+_SP_20 = Gap(0.2*inch)
+_SP_30 = Gap(0.3*inch)
+_SP_50 = Gap(0.5*inch)
+
+POLICY_SPEC = DocSpec('output/Health_Insurance_Policy.pdf', (
     # Title
-    story.append(Paragraph("HEALTH INSURANCE POLICY", title_style))
-    story.append(Spacer(1, 0.2*inch))
+    Text("HEALTH INSURANCE POLICY", _TITLE_POLICY),
+    _SP_20,
     
     # Company header
-    story.append(Paragraph("SecureHealth Insurance Company Ltd.", styles['Normal']))
-    story.append(Paragraph("123 Insurance Plaza, Mumbai - 400001", styles['Normal']))
-    story.append(Paragraph("Phone: 1800-XXX-XXXX | Email: support@securehealth.com", styles['Normal']))
-    story.append(Spacer(1, 0.3*inch))
+    Text("SecureHealth Insurance Company Ltd.", _STYLES['Normal']),
+    Text("123 Insurance Plaza, Mumbai - 400001", _STYLES['Normal']),
+    Text("Phone: 1800-XXX-XXXX | Email: support@securehealth.com", _STYLES['Normal']),
+    _SP_30,
     
     # Policy details
-    story.append(Paragraph("POLICY DETAILS", heading_style))
-    
-    policy_data = [
-        ['Policy Number:', 'POL-2024-MH-789456'],
-        ['Policy Holder:', 'Rajesh Kumar Sharma'],
-        ['Date of Birth:', '15/03/1985'],
-        ['Policy Issue Date:', '01/01/2024'],
-        ['Policy Expiry Date:', '31/12/2024'],
-        ['Sum Assured:', '₹5,00,000'],
-        ['Premium Amount:', '₹15,450 per annum'],
-        ['Policy Type:', 'Individual Health Insurance'],
-    ]
-    
-    policy_table = Table(policy_data, colWidths=[2.5*inch, 4*inch])
-    policy_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#e3f2fd')),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-    ]))
-    story.append(policy_table)
-    story.append(Spacer(1, 0.3*inch))
+    Text("POLICY DETAILS", _HEADING_POLICY),
+    Grid(_POLICY_DATA, _POLICY_COLS, _POLICY_TABLE_STYLE),
+    _SP_30,
     
     # Coverage details
-    story.append(Paragraph("COVERAGE DETAILS", heading_style))
-    
-    coverage_data = [
-        ['Coverage Type', 'Limit'],
-        ['Hospitalization Expenses', '₹5,00,000'],
-        ['Pre-hospitalization (60 days)', '₹25,000'],
-        ['Post-hospitalization (90 days)', '₹25,000'],
-        ['Ambulance Charges', '₹2,000 per hospitalization'],
-        ['Day Care Procedures', 'Covered'],
-        ['Room Rent', '₹3,000 per day (max)'],
-    ]
-    
-    coverage_table = Table(coverage_data, colWidths=[4*inch, 2.5*inch])
-    coverage_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a237e')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f5f5f5')]),
-    ]))
-    story.append(coverage_table)
-    story.append(Spacer(1, 0.3*inch))
+    Text("COVERAGE DETAILS", _HEADING_POLICY),
+    Grid(_COVERAGE_DATA, _COVERAGE_COLS, _COVERAGE_TABLE_STYLE),
+    _SP_30,
     
     # Exclusions
-    story.append(Paragraph("EXCLUSIONS", heading_style))
-    exclusions = """
-    1. Pre-existing diseases (covered after 2 years)<br/>
-    2. Cosmetic or plastic surgery<br/>
-    3. Dental treatment (unless due to accident)<br/>
-    4. Maternity expenses<br/>
-    5. Treatment outside India<br/>
-    6. Self-inflicted injuries<br/>
-    """
-    story.append(Paragraph(exclusions, styles['Normal']))
-    story.append(Spacer(1, 0.3*inch))
+    Text("EXCLUSIONS", _HEADING_POLICY),
+    *(Text(item, _STYLES['Normal']) for item in _EXCLUSION_ITEMS),
+    _SP_30,
     
     # Footer
-    story.append(Spacer(1, 0.5*inch))
-    story.append(Paragraph("This is a computer-generated document and does not require signature.", 
-                          ParagraphStyle('Footer', parent=styles['Normal'], fontSize=8, textColor=colors.grey)))
-    
-    doc.build(story)
-    print(f"✓ Created: {filename}")
+    _SP_50,
+    Text("This is a computer-generated document and does not require signature.", _FOOTER_POLICY),
+))
 
-def create_claim_form():
-    """Create a sample health insurance claim form"""
-    filename = 'output/Health_Insurance_Claim_Form.pdf'
-    doc = SimpleDocTemplate(filename, pagesize=letter)
-    story = []
-    styles = getSampleStyleSheet()
-    
+CLAIM_SPEC = DocSpec('output/Health_Insurance_Claim_Form.pdf', (
     # Title
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=20,
-        textColor=colors.HexColor('#c62828'),
-        spaceAfter=20,
-        alignment=TA_CENTER
-    )
-    
-    story.append(Paragraph("HEALTH INSURANCE CLAIM FORM", title_style))
-    story.append(Spacer(1, 0.2*inch))
+    Text("HEALTH INSURANCE CLAIM FORM", _TITLE_CLAIM),
+    _SP_20,
     
     # Claim details
-    claim_data = [
-        ['Claim Number:', 'CLM-2024-00567'],
-        ['Policy Number:', 'POL-2024-MH-789456'],
-        ['Claim Date:', '15/11/2024'],
-        ['Policy Holder:', 'Rajesh Kumar Sharma'],
-        ['Patient Name:', 'Rajesh Kumar Sharma'],
-        ['Hospital Name:', 'Apollo Hospital, Mumbai'],
-        ['Date of Admission:', '10/11/2024'],
-        ['Date of Discharge:', '13/11/2024'],
-        ['Diagnosis:', 'Acute Appendicitis'],
-        ['Treatment:', 'Appendectomy (Laparoscopic)'],
-        ['Total Claim Amount:', '₹1,25,000'],
-    ]
-    
-    claim_table = Table(claim_data, colWidths=[2.5*inch, 4*inch])
-    claim_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#ffebee')),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-    ]))
-    story.append(claim_table)
-    story.append(Spacer(1, 0.3*inch))
+    Grid(_CLAIM_DATA, _CLAIM_COLS, _CLAIM_TABLE_STYLE),
+    _SP_30,
     
     # Bill breakdown
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=14,
-        textColor=colors.HexColor('#c62828'),
-        spaceAfter=12
-    )
-    
-    story.append(Paragraph("BILL BREAKDOWN", heading_style))
-    
-    bill_data = [
-        ['Description', 'Amount (₹)'],
-        ['Room Charges (3 days @ ₹2,500/day)', '7,500'],
-        ['Surgery Charges', '45,000'],
-        ['Surgeon Fees', '25,000'],
-        ['Anesthesia Charges', '8,000'],
-        ['Medicines and Consumables', '15,500'],
-        ['Diagnostic Tests', '12,000'],
-        ['Nursing Charges', '6,000'],
-        ['Other Hospital Charges', '6,000'],
-        ['TOTAL', '₹1,25,000'],
-    ]
-    
-    bill_table = Table(bill_data, colWidths=[4.5*inch, 2*inch])
-    bill_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#c62828')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-        ('LINEABOVE', (0, -1), (-1, -1), 2, colors.black),
-        ('BACKGROUND', (0, -1), (-1, -1), colors.HexColor('#ffebee')),
-    ]))
-    story.append(bill_table)
-    story.append(Spacer(1, 0.3*inch))
+    Text("BILL BREAKDOWN", _HEADING_CLAIM),
+    Grid(_CLAIM_BILL_DATA, _CLAIM_BILL_COLS, _BILL_TABLE_STYLE),
+    _SP_30,
     
     # Declaration
-    story.append(Paragraph("DECLARATION", heading_style))
-    declaration = """
-    I hereby declare that the information provided above is true and correct to the best of my knowledge. 
-    I understand that any false information may result in rejection of this claim.
-    """
-    story.append(Paragraph(declaration, styles['Normal']))
-    story.append(Spacer(1, 0.3*inch))
+    Text("DECLARATION", _HEADING_CLAIM),
+    Text(_DECLARATION_HTML, _STYLES['Normal']),
+    _SP_30,
     
     # Signature
-    sig_data = [
-        ['Signature:', '_______________________'],
-        ['Date:', '15/11/2024'],
-        ['Place:', 'Mumbai'],
-    ]
-    
-    sig_table = Table(sig_data, colWidths=[1.5*inch, 3*inch])
-    sig_table.setStyle(TableStyle([
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-    ]))
-    story.append(sig_table)
-    
-    doc.build(story)
-    print(f"✓ Created: {filename}")
+    Grid(_SIG_DATA, _SIG_COLS, _SIG_TABLE_STYLE),
+))
 
-def create_hospital_bill():
-    """Create a sample hospital bill"""
-    filename = 'output/Hospital_Bill.pdf'
-    doc = SimpleDocTemplate(filename, pagesize=letter)
-    story = []
-    styles = getSampleStyleSheet()
-    
+BILL_SPEC = DocSpec('output/Hospital_Bill.pdf', (
     # Hospital header
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=22,
-        textColor=colors.HexColor('#00695c'),
-        spaceAfter=10,
-        alignment=TA_CENTER
-    )
-    
-    story.append(Paragraph("APOLLO HOSPITAL", title_style))
-    story.append(Paragraph("Sahar Road, Andheri East, Mumbai - 400069", 
-                          ParagraphStyle('Center', parent=styles['Normal'], alignment=TA_CENTER)))
-    story.append(Paragraph("Phone: 022-XXXX-XXXX | Email: billing@apollomumbai.com", 
-                          ParagraphStyle('Center', parent=styles['Normal'], alignment=TA_CENTER)))
-    story.append(Spacer(1, 0.3*inch))
+    Text("APOLLO HOSPITAL", _TITLE_BILL),
+    Text("Sahar Road, Andheri East, Mumbai - 400069", _CENTER_SMALL),
+    Text("Phone: 022-XXXX-XXXX | Email: billing@apollomumbai.com", _CENTER_SMALL),
+    _SP_30,
     
     # Bill header
-    story.append(Paragraph("FINAL HOSPITAL BILL", 
-                          ParagraphStyle('BillTitle', parent=styles['Heading2'], 
-                                       fontSize=16, textColor=colors.HexColor('#00695c'), alignment=TA_CENTER)))
-    story.append(Spacer(1, 0.2*inch))
+    Text("FINAL HOSPITAL BILL", _BILL_HEADER),
+    _SP_20,
     
     # Patient details
-    patient_data = [
-        ['Bill Number:', 'APL-MUM-2024-5678'],
-        ['Patient Name:', 'Rajesh Kumar Sharma'],
-        ['Age/Gender:', '39 Years / Male'],
-        ['Patient ID:', 'PAT-456789'],
-        ['Admission Date:', '10/11/2024 - 08:30 AM'],
-        ['Discharge Date:', '13/11/2024 - 11:00 AM'],
-        ['Total Days:', '3 Days'],
-        ['Doctor:', 'Dr. Amit Patel (General Surgeon)'],
-        ['Department:', 'General Surgery'],
-    ]
-    
-    patient_table = Table(patient_data, colWidths=[2*inch, 4.5*inch])
-    patient_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#e0f2f1')),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ('TOPPADDING', (0, 0), (-1, -1), 6),
-        ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-    ]))
-    story.append(patient_table)
-    story.append(Spacer(1, 0.3*inch))
+    Grid(_BILL_PATIENT_DATA, _BILL_PATIENT_COLS, _PATIENT_TABLE_STYLE),
+    _SP_30,
     
     # Detailed bill
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=12,
-        textColor=colors.HexColor('#00695c'),
-        spaceAfter=10
-    )
-    
-    story.append(Paragraph("DETAILED BILL", heading_style))
-    
-    detailed_bill = [
-        ['S.No', 'Description', 'Quantity', 'Rate (₹)', 'Amount (₹)'],
-        ['1', 'Room Charges (Semi-Private AC)', '3 days', '2,500', '7,500'],
-        ['2', 'Laparoscopic Appendectomy', '1', '45,000', '45,000'],
-        ['3', 'Surgeon Professional Fees', '1', '25,000', '25,000'],
-        ['4', 'Anesthesia Charges', '1', '8,000', '8,000'],
-        ['5', 'OT Charges', '1', '12,000', '12,000'],
-        ['6', 'Medicines', '-', '-', '15,500'],
-        ['7', 'Injections and IV Fluids', '-', '-', '8,500'],
-        ['8', 'Blood Tests (CBC, LFT, etc.)', '-', '-', '3,500'],
-        ['9', 'Ultrasound Abdomen', '1', '2,000', '2,000'],
-        ['10', 'X-Ray Chest', '1', '800', '800'],
-        ['11', 'ECG', '1', '500', '500'],
-        ['12', 'Nursing Charges', '3 days', '2,000', '6,000'],
-        ['13', 'Consumables', '-', '-', '4,200'],
-        ['14', 'Registration Charges', '1', '500', '500'],
-        ['', '', '', 'SUB-TOTAL:', '₹1,39,000'],
-        ['', '', '', 'Hospital Discount (10%):', '-₹14,000'],
-        ['', '', '', 'TOTAL PAYABLE:', '₹1,25,000'],
-    ]
-    
-    detailed_table = Table(detailed_bill, colWidths=[0.5*inch, 3*inch, 1*inch, 1*inch, 1.5*inch])
-    detailed_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#00695c')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (0, -1), 'CENTER'),
-        ('ALIGN', (2, 0), (-1, -1), 'RIGHT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ('TOPPADDING', (0, 0), (-1, -1), 6),
-        ('GRID', (0, 0), (-1, -3), 1, colors.grey),
-        ('LINEABOVE', (0, -3), (-1, -3), 2, colors.black),
-        ('LINEABOVE', (0, -1), (-1, -1), 2, colors.black),
-        ('BACKGROUND', (0, -1), (-1, -1), colors.HexColor('#e0f2f1')),
-        ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, -1), (-1, -1), 11),
-    ]))
-    story.append(detailed_table)
-    story.append(Spacer(1, 0.3*inch))
+    Text("DETAILED BILL", _HEADING_BILL),
+    Grid(_DETAILED_BILL_DATA, _DETAILED_BILL_COLS, _DETAILED_TABLE_STYLE),
+    _SP_30,
     
     # Payment info
-    story.append(Paragraph("PAYMENT INFORMATION", heading_style))
-    payment = """
-    <b>Amount Paid:</b> ₹1,25,000<br/>
-    <b>Payment Mode:</b> Insurance Claim (SecureHealth Insurance)<br/>
-    <b>Payment Date:</b> 13/11/2024<br/>
-    <b>Status:</b> PAID
-    """
-    story.append(Paragraph(payment, styles['Normal']))
-    story.append(Spacer(1, 0.2*inch))
+    Text("PAYMENT INFORMATION", _HEADING_BILL),
+    Text(_PAYMENT_HTML, _STYLES['Normal']),
+    _SP_20,
     
     # Footer
-    story.append(Paragraph("Thank you for choosing Apollo Hospital. Wishing you good health!", 
-                          ParagraphStyle('Footer', parent=styles['Normal'], fontSize=9, 
-                                       textColor=colors.grey, alignment=TA_CENTER)))
-    
-    doc.build(story)
-    print(f"✓ Created: {filename}")
+    Text("Thank you for choosing Apollo Hospital. Wishing you good health!", _FOOTER_BILL),
+))
 
-def create_discharge_summary():
-    """Create a sample discharge summary"""
-    filename = 'output/Discharge_Summary.pdf'
-    doc = SimpleDocTemplate(filename, pagesize=letter)
-    story = []
-    styles = getSampleStyleSheet()
-    
+DISCHARGE_SPEC = DocSpec('output/Discharge_Summary.pdf', (
     # Header
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=18,
-        textColor=colors.HexColor('#1565c0'),
-        spaceAfter=20,
-        alignment=TA_CENTER
-    )
-    
-    story.append(Paragraph("DISCHARGE SUMMARY", title_style))
-    story.append(Paragraph("Apollo Hospital, Mumbai", 
-                          ParagraphStyle('Center', parent=styles['Normal'], alignment=TA_CENTER, fontSize=10)))
-    story.append(Spacer(1, 0.3*inch))
+    Text("DISCHARGE SUMMARY", _TITLE_DISCHARGE),
+    Text("Apollo Hospital, Mumbai", _CENTER_SMALL),
+    _SP_30,
     
     # Patient info
-    patient_info = [
-        ['Patient Name:', 'Rajesh Kumar Sharma', 'Age/Gender:', '39 Yrs / Male'],
-        ['Patient ID:', 'PAT-456789', 'Admission Date:', '10/11/2024'],
-        ['Discharge Date:', '13/11/2024', 'Total Stay:', '3 Days'],
-    ]
-    
-    patient_table = Table(patient_info, colWidths=[1.5*inch, 2*inch, 1.5*inch, 1.5*inch])
-    patient_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#e3f2fd')),
-        ('BACKGROUND', (2, 0), (2, -1), colors.HexColor('#e3f2fd')),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTNAME', (2, 0), (2, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ('TOPPADDING', (0, 0), (-1, -1), 6),
-        ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-    ]))
-    story.append(patient_table)
-    story.append(Spacer(1, 0.2*inch))
+    Grid(_DISCHARGE_PATIENT_DATA, _DISCHARGE_PATIENT_COLS, _DISCHARGE_PATIENT_STYLE),
+    _SP_20,
     
     # Medical details
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=12,
-        textColor=colors.HexColor('#1565c0'),
-        spaceAfter=8,
-        spaceBefore=10
-    )
-    
-    story.append(Paragraph("DIAGNOSIS", heading_style))
-    story.append(Paragraph("Acute Appendicitis with peritonitis", styles['Normal']))
-    story.append(Spacer(1, 0.1*inch))
-    
-    story.append(Paragraph("PROCEDURE PERFORMED", heading_style))
-    story.append(Paragraph("Laparoscopic Appendectomy under General Anesthesia", styles['Normal']))
-    story.append(Spacer(1, 0.1*inch))
-    
-    story.append(Paragraph("CLINICAL SUMMARY", heading_style))
-    clinical = """
-    Patient presented to emergency department with complaints of severe abdominal pain in right lower quadrant 
-    for 12 hours, associated with nausea and vomiting. On examination, patient was febrile (101.2°F) with 
-    tenderness and guarding in right iliac fossa. McBurney's point tenderness was positive. Blood investigations 
-    showed elevated WBC count (14,500/cumm). Ultrasound abdomen confirmed acute appendicitis. Patient was 
-    taken up for emergency laparoscopic appendectomy. Procedure was uneventful. Post-operative recovery was 
-    satisfactory.
-    """
-    story.append(Paragraph(clinical, styles['Normal']))
-    story.append(Spacer(1, 0.1*inch))
-    
-    story.append(Paragraph("CONDITION AT DISCHARGE", heading_style))
-    story.append(Paragraph("Stable, afebrile, wound healing well", styles['Normal']))
-    story.append(Spacer(1, 0.1*inch))
-    
-    story.append(Paragraph("MEDICATIONS ON DISCHARGE", heading_style))
-    meds = """
-    1. Tab. Amoxicillin + Clavulanic Acid 625mg - TDS for 5 days<br/>
-    2. Tab. Diclofenac 50mg - SOS for pain<br/>
-    3. Tab. Pantoprazole 40mg - OD for 7 days<br/>
-    4. Syrup Lactulose 15ml - HS for 5 days
-    """
-    story.append(Paragraph(meds, styles['Normal']))
-    story.append(Spacer(1, 0.1*inch))
-    
-    story.append(Paragraph("ADVICE ON DISCHARGE", heading_style))
-    advice = """
-    1. Keep surgical wound clean and dry<br/>
-    2. Avoid heavy lifting for 2 weeks<br/>
-    3. Light diet for 3-4 days, then normal diet<br/>
-    4. Follow-up after 7 days for suture removal<br/>
-    5. Report immediately if fever, wound discharge, or severe pain
-    """
-    story.append(Paragraph(advice, styles['Normal']))
-    story.append(Spacer(1, 0.3*inch))
+    Text("DIAGNOSIS", _HEADING_DISCHARGE),
+    Text("Acute Appendicitis with peritonitis", _STYLES['Normal']),
+    _SP_10,
+    
+    Text("PROCEDURE PERFORMED", _HEADING_DISCHARGE),
+    Text("Laparoscopic Appendectomy under General Anesthesia", _STYLES['Normal']),
+    _SP_10,
+    
+    Text("CLINICAL SUMMARY", _HEADING_DISCHARGE),
+    Text(_CLINICAL_HTML, _STYLES['Normal']),
+    _SP_10,
+    
+    Text("CONDITION AT DISCHARGE", _HEADING_DISCHARGE),
+    Text("Stable, afebrile, wound healing well", _STYLES['Normal']),
+    _SP_10,
+    
+    Text("MEDICATIONS ON DISCHARGE", _HEADING_DISCHARGE),
+    *(Text(item, _STYLES['Normal']) for item in _MEDICATION_ITEMS),
+    _SP_10,
+    
+    Text("ADVICE ON DISCHARGE", _HEADING_DISCHARGE),
+    *(Text(item, _STYLES['Normal']) for item in _ADVICE_ITEMS),
+    _SP_30,
     
     # Doctor signature
-    story.append(Spacer(1, 0.3*inch))
-    story.append(Paragraph("Dr. Amit Patel", 
-                          ParagraphStyle('Sign', parent=styles['Normal'], fontSize=11, fontName='Helvetica-Bold')))
-    story.append(Paragraph("MS (General Surgery)", styles['Normal']))
-    story.append(Paragraph("Registration No: MH-12345", styles['Normal']))
-    story.append(Paragraph("Date: 13/11/2024", styles['Normal']))
+    _SP_30,
+    Text("Dr. Amit Patel", _SIGNATURE_STYLE),
+    Text("MS (General Surgery)", _STYLES['Normal']),
+    Text("Registration No: MH-12345", _STYLES['Normal']),
+    Text("Date: 13/11/2024", _STYLES['Normal']),
+))
+
+# Documents by name, so pool workers can be handed a picklable key
+_SPECS = {
+    'policy': POLICY_SPEC,
+    'claim': CLAIM_SPEC,
+    'bill': BILL_SPEC,
+    'discharge': DISCHARGE_SPEC,
+}
+
+def create_health_insurance_policy():
+    """Create a sample health insurance policy document"""
+    render(POLICY_SPEC)
+
+def create_claim_form():
+    """Create a sample health insurance claim form"""
+    render(CLAIM_SPEC)
+
+def create_hospital_bill():
+    """Create a sample hospital bill"""
+    render(BILL_SPEC)
+
+def create_discharge_summary():
+    """Create a sample discharge summary"""
+    render(DISCHARGE_SPEC)
+
+def _invoke(name, force=False):
+    """Render one document by name (pool worker entry point)"""
+    render(_SPECS[name], force)
+
+def _warm_up(names):
+    """
+    Load ReportLab and fill the flowable caches in this process.
     
-    doc.build(story)
-    print(f"✓ Created: {filename}")
+    Run in the parent before the pool forks, so workers inherit the imported
+    platypus modules, font metrics, parsed paragraphs and table styles instead
+    of each loading them again (~55 ms of imports per worker).
+    
+    Args:
+        names: Documents about to be rendered
+    """
+    from reportlab.pdfbase import pdfmetrics
+    import reportlab.platypus
+    
+    for font in ('Helvetica', 'Helvetica-Bold'):
+        pdfmetrics.getFont(font)
+    for name in names:
+        for section in _SPECS[name].sections:
+            if not isinstance(section, Gap):
+                section.build()
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('--only', choices=list(_SPECS), action='append',
+                        help='generate only this document (repeatable; default: all)')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1,
+                        help='worker processes to render with (default: CPU count)')
+    parser.add_argument('--force', action='store_true',
+                        help='rebuild documents even if an up-to-date copy exists')
+    args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error('--jobs must be at least 1')
+    
     print("\n" + "="*60)
     print("Creating Sample Health Insurance Documents")
     print("="*60 + "\n")
     
-    create_health_insurance_policy()
-    create_claim_form()
-    create_hospital_bill()
-    create_discharge_summary()
+    # Create output directory once, before any worker starts writing into it
+    os.makedirs('output', exist_ok=True)
+    
+    # Up-to-date documents are reported here instead of being handed to a worker
+    chosen = list(dict.fromkeys(args.only or _SPECS))
+    pending = []
+    for name in chosen:
+        if args.force or not _is_current(_SPECS[name].filename):
+            pending.append(name)
+        else:
+            print(f"✓ Cached: {_SPECS[name].filename}")
+    
+    # The documents are independent, so render them in parallel when there is
+    # more than one to build and more than one job allowed; otherwise the pool
+    # would only add process start-up cost
+    workers = min(len(pending), args.jobs)
+    if workers > 1:
+        # Forked workers share the warmed-up parent state copy-on-write; where
+        # fork is unavailable (Windows) each spawned worker loads its own
+        _warm_up(pending)
+        fork = 'fork' in multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context('fork' if fork else None)
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as ex:
+            # Freshness was checked above, so workers build unconditionally
+            list(ex.map(_invoke, pending, [True] * len(pending)))
+    else:
+        for name in pending:
+            _invoke(name, True)
+    
+    print(f"\nBuilt {len(pending)}, skipped {len(chosen) - len(pending)} up to date")
     
     print("\n" + "="*60)
     print("✓ All sample documents created successfully!")